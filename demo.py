@@ -7,207 +7,222 @@ Demonstrates:
 3. Authorization working consistently across entry points
 4. Slack blocked from sensitive tools due to weak auth
 """
-import jwt
+import sys
+import hmac
+import time
+import base64
+import hashlib
 import httpx
+import orjson
 import asyncio
-from datetime import datetime, timedelta
+import functools
 
+from src._term import use_uvloop
 
-BASE_URL = "http://localhost:8000"
+
+# IPv4 literal: the server binds 0.0.0.0, so "localhost" would cost a name
+# lookup (and a refused ::1 attempt where it resolves to IPv6 first) per connect
+BASE_URL = "http://127.0.0.1:8000"
 JWT_SECRET = "demo-secret-key"
 
+# Pre-encoded base64url of the fixed JWT header {"alg":"HS256","typ":"JWT"}
+_JWT_HEADER_B64 = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
+_JWT_KEY = JWT_SECRET.encode()
+
+# Static request fixtures
+ALICE_COOKIES = {"session_id": "sess_alice_123"}
+BOB_COOKIES = {"session_id": "sess_bob_456"}  # Bob only has rag:read
+SLACK_HEADERS_TEMPLATE = {"x-slack-user-id": "U01ABC123"}
+SLACK_SIGNING_SECRET = b"slack-signing-secret"
+RAG_QUERY = {"query": "What is the capital of France?"}
+RAG_QUERY_BODY = orjson.dumps(RAG_QUERY)  # Slack signs the exact body bytes
+
+# Shared connection pool limits - one client is reused across all demos
+# (keep-alive headroom covers every request gather() fires at once, and idle
+# connections survive the pauses of the interactive demos)
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=600)
+CLIENT_TIMEOUT = httpx.Timeout(5.0, connect=1.0)
+
+
+def create_client() -> httpx.AsyncClient:
+    """Create the shared demo client (keep-alive pool bound to BASE_URL)."""
+    return httpx.AsyncClient(base_url=BASE_URL, limits=CLIENT_LIMITS, timeout=CLIENT_TIMEOUT)
+
+
+async def _probe_ready(timeout: float = 10.0) -> bool:
+    """Poll the server root until it answers 200 (or the timeout expires)."""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    async with create_client() as client:
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get("/", timeout=0.2)
+                if response.status_code == 200:
+                    return True
+            except httpx.TransportError:
+                pass
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+
+    return False
+
 
 def create_jwt(principal_id: str, role: str, tenant_id: str = None) -> str:
-    """Create a demo JWT token."""
-    payload = {
+    """
+    Create a demo JWT token.
+
+    Tokens are cached per (principal_id, role, tenant_id) and minute of
+    issue, so repeated calls reuse the same encoded string.
+    """
+    return _encode_jwt(principal_id, role, tenant_id, int(time.time()) // 60)
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_jwt(principal_id: str, role: str, tenant_id: str, issued_minute: int) -> str:
+    """Encode a JWT that expires one hour after its issue minute."""
+    payload = orjson.dumps({
         "sub": principal_id,
         "role": role,
         "tenant_id": tenant_id,
-        "exp": datetime.utcnow() + timedelta(hours=1)
+        "exp": (issued_minute + 60) * 60
+    })
+    # HS256 by hand: only the payload and signature vary, the header is fixed
+    signing_input = f"{_JWT_HEADER_B64}.{_b64url(payload)}"
+    signature = hmac.new(_JWT_KEY, signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{_b64url(signature)}"
+
+
+def _b64url(data: bytes) -> str:
+    """Unpadded base64url encoding, as used by JWT."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def slack_signature(timestamp: str, body: bytes = b"") -> str:
+    """Compute a Slack v0 request signature for the demo signing secret."""
+    base = b"v0:" + timestamp.encode() + b":" + body
+    return "v0=" + hmac.new(SLACK_SIGNING_SECRET, base, hashlib.sha256).hexdigest()
+
+
+def slack_headers(body: bytes = b"") -> dict:
+    """Build signed Slack headers for a request with the given body."""
+    timestamp = str(int(time.time()))
+    return {
+        **SLACK_HEADERS_TEMPLATE,
+        "x-slack-request-timestamp": timestamp,
+        "x-slack-signature": slack_signature(timestamp, body)
     }
-    return jwt.encode(payload, JWT_SECRET, algorithm="HS256")
-
-
-async def demo():
-    """Run the complete demo."""
-    async with httpx.AsyncClient() as client:
-        print("=" * 80)
-        print("UNIVERSAL CALLER ADAPTER POC - DEMO")
-        print("=" * 80)
-        print()
-
-        # Demo 1: Cookie Authentication
-        print("📍 DEMO 1: Cookie Authentication (Platform)")
-        print("-" * 80)
-        cookies = {"session_id": "sess_alice_123"}
-        response = await client.get(f"{BASE_URL}/whoami", cookies=cookies)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        print()
-
-        # Demo 2: OAuth Authentication
-        print("📍 DEMO 2: OAuth/JWT Authentication")
-        print("-" * 80)
-        token = create_jwt("user_bob", "admin", "acme_corp")
-        headers = {"Authorization": f"Bearer {token}"}
-        response = await client.get(f"{BASE_URL}/whoami", headers=headers)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        print()
-
-        # Demo 3: Slack Authentication
-        print("📍 DEMO 3: Slack Authentication")
-        print("-" * 80)
-        slack_headers = {
-            "x-slack-signature": "v0=abc123",
-            "x-slack-request-timestamp": str(int(datetime.utcnow().timestamp())),
-            "x-slack-user-id": "U01ABC123"
-        }
-        response = await client.get(f"{BASE_URL}/whoami", headers=slack_headers)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        print()
-
-        # Demo 4: Anonymous (no auth)
-        print("📍 DEMO 4: Anonymous (No Authentication)")
-        print("-" * 80)
-        response = await client.get(f"{BASE_URL}/whoami")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        print()
-
-        print("=" * 80)
-        print("AUTHORIZATION DEMOS - Same Tool, Different Auth Methods")
-        print("=" * 80)
-        print()
-
-        # Demo 5: RAG Search via Cookie (SUCCESS)
-        print("📍 DEMO 5: RAG Search via Cookie (SHOULD SUCCEED)")
-        print("-" * 80)
-        cookies = {"session_id": "sess_alice_123"}
-        response = await client.post(
-            f"{BASE_URL}/tools/rag-search",
-            json={"query": "What is the capital of France?"},
-            cookies=cookies
-        )
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        print()
-
-        # Demo 6: RAG Search via OAuth (SUCCESS)
-        print("📍 DEMO 6: RAG Search via OAuth (SHOULD SUCCEED)")
-        print("-" * 80)
-        token = create_jwt("user_carol", "user", "acme_corp")
-        headers = {"Authorization": f"Bearer {token}"}
-        response = await client.post(
-            f"{BASE_URL}/tools/rag-search",
-            json={"query": "What is the capital of France?"},
-            headers=headers
-        )
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        print()
-
-        # Demo 7: RAG Search via Slack (SUCCESS - weak auth is OK)
-        print("📍 DEMO 7: RAG Search via Slack (SHOULD SUCCEED - weak auth OK)")
-        print("-" * 80)
-        slack_headers = {
-            "x-slack-signature": "v0=abc123",
-            "x-slack-request-timestamp": str(int(datetime.utcnow().timestamp())),
-            "x-slack-user-id": "U01ABC123"
-        }
-        response = await client.post(
-            f"{BASE_URL}/tools/rag-search",
-            json={"query": "What is the capital of France?"},
-            headers=slack_headers
-        )
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        print()
-
-        print("=" * 80)
-        print("SENSITIVE TOOL DEMOS - Strong Auth Required")
-        print("=" * 80)
-        print()
-
-        # Demo 8: Diagnostics via Cookie (SUCCESS)
-        print("📍 DEMO 8: Diagnostics via Cookie (SHOULD SUCCEED)")
-        print("-" * 80)
-        cookies = {"session_id": "sess_alice_123"}
-        response = await client.post(
-            f"{BASE_URL}/tools/diagnostics",
-            cookies=cookies
-        )
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            print(f"Response: {response.json()}")
-        else:
-            print(f"Error: {response.json()}")
-        print()
-
-        # Demo 9: Diagnostics via OAuth (SUCCESS)
-        print("📍 DEMO 9: Diagnostics via OAuth (SHOULD SUCCEED)")
-        print("-" * 80)
-        token = create_jwt("user_dave", "admin", "acme_corp")
-        headers = {"Authorization": f"Bearer {token}"}
-        response = await client.post(
-            f"{BASE_URL}/tools/diagnostics",
-            headers=headers
-        )
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            print(f"Response: {response.json()}")
+
+
+def format_header(title: str) -> str:
+    """Format a section banner."""
+    rule = "=" * 80
+    return f"{rule}\n{title}\n{rule}\n\n"
+
+
+def format_result(title: str, response, expect_error: bool = False) -> str:
+    """Format the outcome of a single demo request."""
+    if isinstance(response, Exception):
+        body = f"Request failed: {response}"
+    else:
+        if expect_error:
+            label = "Error (expected)"
+        elif response.status_code == 200:
+            label = "Response"
         else:
-            print(f"Error: {response.json()}")
-        print()
-
-        # Demo 10: Diagnostics via Slack (FAIL - weak auth not allowed)
-        print("📍 DEMO 10: Diagnostics via Slack (SHOULD FAIL - weak auth)")
-        print("-" * 80)
-        slack_headers = {
-            "x-slack-signature": "v0=abc123",
-            "x-slack-request-timestamp": str(int(datetime.utcnow().timestamp())),
-            "x-slack-user-id": "U01ABC123"
-        }
-        response = await client.post(
-            f"{BASE_URL}/tools/diagnostics",
-            headers=slack_headers
-        )
-        print(f"Status: {response.status_code}")
-        print(f"Error (expected): {response.json()}")
-        print()
-
-        # Demo 11: Missing entitlements
-        print("📍 DEMO 11: Missing Entitlements (SHOULD FAIL)")
-        print("-" * 80)
-        cookies = {"session_id": "sess_bob_456"}  # Bob only has rag:read
-        response = await client.post(
-            f"{BASE_URL}/tools/diagnostics",
-            cookies=cookies
-        )
-        print(f"Status: {response.status_code}")
-        print(f"Error (expected): {response.json()}")
-        print()
-
-        print("=" * 80)
-        print("DEMO COMPLETE")
-        print("=" * 80)
-        print()
-        print("Key Takeaways:")
-        print("✓ All entry points normalize to the same Principal structure")
-        print("✓ Authorization is centralized and consistent")
-        print("✓ Tools are auth-agnostic")
-        print("✓ Slack blocked from sensitive tools due to weak auth")
-        print("✓ Architecture is clear and extensible")
+            label = "Error"
+        body = f"Status: {response.status_code}\n{label}: {response.json()}"
+    return f"📍 {title}\n{'-' * 80}\n{body}\n\n"
+
+
+async def demo(client: httpx.AsyncClient = None):
+    """
+    Run the complete demo.
+
+    All requests are independent, so they are dispatched concurrently and
+    the results are printed afterwards in demo order.
+
+    Args:
+        client: Shared HTTP client (a new one is created if not provided)
+    """
+    if client is None:
+        async with create_client() as client:
+            return await demo(client)
+
+    # Signed once per run: bodiless requests share one set of Slack headers
+    slack_empty = slack_headers()
+    slack_rag = {**slack_headers(RAG_QUERY_BODY), "content-type": "application/json"}
+
+    def bearer(principal_id: str, role: str) -> dict:
+        return {"Authorization": f"Bearer {create_jwt(principal_id, role, 'acme_corp')}"}
+
+    # (section banner, [(title, request coroutine, failure expected), ...])
+    sections = [
+        ("UNIVERSAL CALLER ADAPTER POC - DEMO", [
+            ("DEMO 1: Cookie Authentication (Platform)",
+             client.get("/whoami", cookies=ALICE_COOKIES), False),
+            ("DEMO 2: OAuth/JWT Authentication",
+             client.get("/whoami", headers=bearer("user_bob", "admin")), False),
+            ("DEMO 3: Slack Authentication",
+             client.get("/whoami", headers=slack_empty), False),
+            ("DEMO 4: Anonymous (No Authentication)",
+             client.get("/whoami"), False),
+        ]),
+        ("AUTHORIZATION DEMOS - Same Tool, Different Auth Methods", [
+            ("DEMO 5: RAG Search via Cookie (SHOULD SUCCEED)",
+             client.post("/tools/rag-search", json=RAG_QUERY, cookies=ALICE_COOKIES), False),
+            ("DEMO 6: RAG Search via OAuth (SHOULD SUCCEED)",
+             client.post("/tools/rag-search", json=RAG_QUERY, headers=bearer("user_carol", "user")), False),
+            ("DEMO 7: RAG Search via Slack (SHOULD SUCCEED - weak auth OK)",
+             client.post("/tools/rag-search", content=RAG_QUERY_BODY, headers=slack_rag), False),
+        ]),
+        ("SENSITIVE TOOL DEMOS - Strong Auth Required", [
+            ("DEMO 8: Diagnostics via Cookie (SHOULD SUCCEED)",
+             client.post("/tools/diagnostics", cookies=ALICE_COOKIES), False),
+            ("DEMO 9: Diagnostics via OAuth (SHOULD SUCCEED)",
+             client.post("/tools/diagnostics", headers=bearer("user_dave", "admin")), False),
+            ("DEMO 10: Diagnostics via Slack (SHOULD FAIL - weak auth)",
+             client.post("/tools/diagnostics", headers=slack_empty), True),
+            ("DEMO 11: Missing Entitlements (SHOULD FAIL)",
+             client.post("/tools/diagnostics", cookies=BOB_COOKIES), True),
+        ]),
+    ]
+
+    # Fire every request at once - none depends on another's result
+    responses = iter(await asyncio.gather(
+        *(request for _, steps in sections for _, request, _ in steps),
+        return_exceptions=True
+    ))
+
+    # One write per section instead of a print() per line
+    for banner, steps in sections:
+        sys.stdout.write(format_header(banner) + "".join(
+            format_result(title, next(responses), expect_error)
+            for title, _, expect_error in steps
+        ))
+
+    sys.stdout.write(format_header("DEMO COMPLETE") + "\n".join([
+        "Key Takeaways:",
+        "✓ All entry points normalize to the same Principal structure",
+        "✓ Authorization is centralized and consistent",
+        "✓ Tools are auth-agnostic",
+        "✓ Slack blocked from sensitive tools due to weak auth",
+        "✓ Architecture is clear and extensible",
+    ]) + "\n")
 
 
 if __name__ == "__main__":
+    use_uvloop()
+
     print()
     print("Starting comprehensive demo...")
     print("Note: Use 'python run_demo.py' for automatic server management")
     print("      or make sure the server is running: python main.py")
     print()
-    input("Press Enter when server is ready...")
+    if sys.stdin.isatty():
+        input("Press Enter when server is ready...")
+    elif not asyncio.run(_probe_ready()):
+        print(f"Server at {BASE_URL} did not become ready - continuing anyway")
     print()
 
     asyncio.run(demo())
@@ -3,7 +3,10 @@ Universal Caller Adapter - POC
 
 Demonstrates unified authentication/authorization across multiple entry points.
 """
+from typing import Optional, Tuple
+
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.models import Principal, AuthStrength
@@ -18,18 +21,28 @@ class RagSearchRequest(BaseModel):
     query: str
 
 
+class PrincipalInfo(BaseModel):
+    principal_id: str
+    tenant_id: Optional[str] = None
+    auth_method: str
+    auth_strength: str
+    entitlements: Tuple[str, ...] = ()
+    is_authenticated: bool
+
+
 class ToolResponse(BaseModel):
     success: bool
     data: dict = None
     error: str = None
-    principal_info: dict = None
+    principal_info: PrincipalInfo = None
 
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Universal Caller Adapter POC",
     description="Demonstrates unified auth across Cookie, OAuth, and Slack entry points",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson's C encoder on every response
 )
 
 
@@ -51,6 +64,10 @@ authorizer.register_policy(ToolPolicy(
     description="System diagnostics - sensitive operation"
 ))
 
+# Resolve tool IDs once so each request authorizes without a name lookup
+RAG_SEARCH_TOOL = authorizer.resolve_tool_id("rag_search")
+DIAGNOSTICS_TOOL = authorizer.resolve_tool_id("diagnostics")
+
 
 # Initialize authentication adapters
 cookie_adapter = CookieAdapter()
@@ -71,16 +88,16 @@ def get_principal(request: Request) -> Principal:
 
 
 # Helper to format principal info
-def format_principal_info(principal: Principal) -> dict:
-    """Format principal for response."""
-    return {
-        "principal_id": principal.principal_id,
-        "tenant_id": principal.tenant_id,
-        "auth_method": principal.auth_method.value,
-        "auth_strength": principal.auth_strength.value,
-        "entitlements": list(principal.entitlements),
-        "is_authenticated": principal.is_authenticated
-    }
+def format_principal_info(principal: Principal) -> PrincipalInfo:
+    """Format principal for response (fields are trusted, so skip validation)."""
+    return PrincipalInfo.model_construct(
+        principal_id=principal.principal_id,
+        tenant_id=principal.tenant_id,
+        auth_method=principal.auth_method.value,
+        auth_strength=principal.auth_strength.label,
+        entitlements=principal.entitlements_list,
+        is_authenticated=principal.is_authenticated
+    )
 
 
 # Endpoints
@@ -127,12 +144,13 @@ async def invoke_rag_search(request: Request, body: RagSearchRequest):
 
     try:
         # Centralized authorization (happens here, not in tool)
-        authorizer.authorize(principal, "rag_search")
+        authorizer.authorize_by_id(principal, RAG_SEARCH_TOOL)
 
         # Tool invocation (auth-agnostic)
         result = await rag_search(principal, body.query)
 
-        return ToolResponse(
+        # Tool output is trusted - skip re-validating it on the way out
+        return ToolResponse.model_construct(
             success=True,
             data=result,
             principal_info=format_principal_info(principal)
@@ -145,7 +163,7 @@ async def invoke_rag_search(request: Request, body: RagSearchRequest):
                 "error": "Authorization failed",
                 "message": str(e),
                 "reason": e.reason,
-                "principal": format_principal_info(principal)
+                "principal": format_principal_info(principal).model_dump()
             }
         )
 
@@ -163,12 +181,13 @@ async def invoke_diagnostics(request: Request):
 
     try:
         # Centralized authorization
-        authorizer.authorize(principal, "diagnostics")
+        authorizer.authorize_by_id(principal, DIAGNOSTICS_TOOL)
 
         # Tool invocation
         result = await diagnostics(principal)
 
-        return ToolResponse(
+        # Tool output is trusted - skip re-validating it on the way out
+        return ToolResponse.model_construct(
             success=True,
             data=result,
             principal_info=format_principal_info(principal)
@@ -181,7 +200,7 @@ async def invoke_diagnostics(request: Request):
                 "error": "Authorization failed",
                 "message": str(e),
                 "reason": e.reason,
-                "principal": format_principal_info(principal)
+                "principal": format_principal_info(principal).model_dump()
             }
         )
 
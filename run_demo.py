@@ -15,44 +15,73 @@ Usage:
 """
 
 import asyncio
+import io
+import os
+import json
 import subprocess
 import time
 import sys
 import signal
+import threading
 import argparse
+import traceback
 from typing import Optional
 
-# Color codes for pretty terminal output
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+import demo
+import simple_demo
+from src._term import Colors, use_uvloop
+
+# os.killpg (and start_new_session) only exist on POSIX
+_HAS_PROCESS_GROUPS = hasattr(os, "killpg")
 
 
 class ServerManager:
     """Manages starting and stopping the demo server"""
 
+    # Logged by uvicorn (on stderr) only after the listening socket is bound.
+    # "Application startup complete" comes earlier (before the bind), so it
+    # would report ready before port 8000 accepts connections - or even when
+    # the bind is about to fail because the port is taken.
+    READY_LINE = "Uvicorn running on"
+
     def __init__(self):
         self.process: Optional[subprocess.Popen] = None
+        self._startup_done = threading.Event()
+        self._started = False
 
     def start(self):
-        """Start the server in the background"""
+        """Launch the server process without waiting for it to be ready"""
+        if self.process:
+            return
+
         print(f"{Colors.BLUE}Starting server...{Colors.END}")
         try:
+            # stdout is unused; stderr is tailed (and fully drained) by a
+            # watcher thread so uvicorn can never block on a full pipe.
+            # On POSIX the server gets its own process group so stop() can
+            # signal it and anything it spawned in one go.
             self.process = subprocess.Popen(
                 [sys.executable, "main.py"],
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True
+                text=True,
+                bufsize=1,
+                start_new_session=_HAS_PROCESS_GROUPS
             )
+            threading.Thread(target=self._watch_stderr, daemon=True).start()
+            threading.Thread(target=self._watch_exit, daemon=True).start()
+
+        except Exception as e:
+            print(f"{Colors.RED}Failed to start server: {e}{Colors.END}")
+            sys.exit(1)
 
+    async def start_async(self):
+        """Start the server (if not already launched) and wait until it is ready"""
+        self.start()
+        try:
             # Wait for server to be ready
             print(f"{Colors.BLUE}Waiting for server to be ready...{Colors.END}")
-            if not self._wait_for_server():
+            if not await self._wait_for_server():
                 print(f"{Colors.RED}Server failed to start!{Colors.END}")
                 self.stop()
                 sys.exit(1)
@@ -63,88 +92,103 @@ class ServerManager:
             print(f"{Colors.RED}Failed to start server: {e}{Colors.END}")
             sys.exit(1)
 
-    def _wait_for_server(self, timeout: int = 10) -> bool:
-        """Wait for server to respond to health checks"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                # Check if process is still running
-                if self.process.poll() is not None:
-                    return False
+    def _watch_stderr(self):
+        """Drain server stderr, flagging readiness once uvicorn is listening."""
+        for line in iter(self.process.stderr.readline, ''):
+            if not self._started and self.READY_LINE in line:
+                self._started = True
+                self._startup_done.set()
 
-                # Try to connect to server
-                import socket
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex(('localhost', 8000))
-                sock.close()
+        # EOF - the server exited (before or after startup); wake any waiter
+        self._startup_done.set()
 
-                if result == 0:
-                    # Give it a moment to fully initialize
-                    time.sleep(0.5)
-                    return True
+    def _watch_exit(self):
+        """
+        Wake the startup waiter the moment the server process exits.
 
-            except Exception:
-                pass
+        Blocks in waitpid rather than polling, and does not depend on stderr
+        reaching EOF (a stray grandchild could keep the pipe open).
+        """
+        self.process.wait()
+        self._startup_done.set()
 
-            time.sleep(0.5)
+    async def _wait_for_server(self, timeout: int = 10) -> bool:
+        """
+        Wait for uvicorn to report that it is listening.
 
-        return False
+        Returns as soon as the "running on" line is logged, or False if the server
+        exits or the timeout expires first. No polling, no warm-up sleep.
+        """
+        await asyncio.to_thread(self._startup_done.wait, timeout)
+        return self._started
 
     def stop(self):
         """Stop the server"""
         if self.process:
             print(f"\n{Colors.BLUE}Stopping server...{Colors.END}")
             try:
-                self.process.terminate()
+                self._signal(force=False)
                 try:
                     self.process.wait(timeout=5)
                 except subprocess.TimeoutExpired:
-                    self.process.kill()
+                    self._signal(force=True)
                     self.process.wait()
                 print(f"{Colors.GREEN}✓ Server stopped{Colors.END}")
             except Exception as e:
                 print(f"{Colors.YELLOW}Warning: Error stopping server: {e}{Colors.END}")
 
+    def _signal(self, force):
+        """Terminate (or, with force, kill) the server's whole process group.
+
+        Platforms without process groups (Windows) only get the server itself.
+        """
+        if not _HAS_PROCESS_GROUPS:
+            if force:
+                self.process.kill()
+            else:
+                self.process.terminate()
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # Already gone
+
 
-async def run_simple_demo():
+async def run_simple_demo(client):
     """
     Run the simple educational demo.
 
     This demo explains the concepts step-by-step with interactive prompts.
     Perfect for learning how the Universal Caller Adapter works.
     """
-    # Import the simple demo module
-    import simple_demo
+    await simple_demo.main(client)
 
-    await simple_demo.main()
 
-
-async def run_full_demo():
+async def run_full_demo(client):
     """
     Run the comprehensive demo.
 
     This demo shows all authentication methods and authorization scenarios
     in a comprehensive, automated way.
     """
-    # Import the full demo module
-    import demo
+    await demo.demo(client)
+
 
-    await demo.demo()
+def _sign_slack_request(auth_configs: dict, body: bytes):
+    """Refresh the Slack timestamp and signature in place (no dict rebuild)."""
+    headers = auth_configs["3"]["headers"]
+    timestamp = str(int(time.time()))
+    headers["x-slack-request-timestamp"] = timestamp
+    headers["x-slack-signature"] = demo.slack_signature(timestamp, body)
 
 
-async def run_playground_demo():
+async def run_playground_demo(client):
     """
     Run the interactive playground mode.
 
     Allows users to experiment with different auth methods and tool calls
     to see real-time server responses.
     """
-    import httpx
-    import jwt
-    from datetime import datetime, timedelta
-    import json
-
     # Auth method configurations
     auth_configs = {
         "1": {
@@ -163,8 +207,8 @@ async def run_playground_demo():
             "name": "Slack Authentication",
             "description": "Slack signature (weak auth)",
             "headers": {
-                "x-slack-signature": "v0=mock_signature_for_demo",
-                "x-slack-request-timestamp": str(int(datetime.now().timestamp())),
+                "x-slack-signature": "",  # signed per request
+                "x-slack-request-timestamp": "",
                 "x-slack-user-id": "U_SLACK_001"
             },
             "cookies": {}
@@ -177,17 +221,8 @@ async def run_playground_demo():
         }
     }
 
-    # Generate OAuth token for option 2
-    oauth_token = jwt.encode(
-        {
-            'sub': 'user_bob',
-            'role': 'developer',
-            'tenant_id': 'acme',
-            'exp': datetime.utcnow() + timedelta(hours=1)
-        },
-        'demo-secret-key',
-        algorithm='HS256'
-    )
+    # Generate OAuth token for option 2 (once, outside the playground loop)
+    oauth_token = demo.create_jwt('user_bob', 'developer', 'acme')
     auth_configs["2"]["headers"]["Authorization"] = f"Bearer {oauth_token}"
 
     # Tool configurations
@@ -222,117 +257,125 @@ async def run_playground_demo():
     print(f"{Colors.YELLOW}Experiment with different auth methods and tool calls!{Colors.END}")
     print(f"{Colors.YELLOW}See real-time server responses and authorization behavior.{Colors.END}\n")
 
-    async with httpx.AsyncClient() as client:
-        while True:
-            # Select auth method
-            print(f"\n{Colors.BOLD}Select Authentication Method:{Colors.END}\n")
-            for key, config in auth_configs.items():
-                print(f"{Colors.GREEN}{key}. {config['name']}{Colors.END}")
-                print(f"   {config['description']}\n")
-
-            auth_choice = input(f"{Colors.BOLD}Choose auth method (1-4, or 'q' to quit): {Colors.END}").strip()
-
-            if auth_choice.lower() == 'q':
-                break
-
-            if auth_choice not in auth_configs:
-                print(f"{Colors.RED}Invalid choice. Please try again.{Colors.END}")
-                continue
-
-            auth_config = auth_configs[auth_choice]
-
-            # Select tool
-            print(f"\n{Colors.BOLD}Select Tool to Call:{Colors.END}\n")
-            for key, tool in tools.items():
-                print(f"{Colors.GREEN}{key}. {tool['name']}{Colors.END}")
-                print(f"   {tool['description']}\n")
-
-            tool_choice = input(f"{Colors.BOLD}Choose tool (1-3): {Colors.END}").strip()
-
-            if tool_choice not in tools:
-                print(f"{Colors.RED}Invalid choice. Please try again.{Colors.END}")
-                continue
-
-            tool = tools[tool_choice]
-
-            # Display request details
-            print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}")
-            print(f"{Colors.BOLD}Request Details:{Colors.END}\n")
-            print(f"{Colors.BOLD}Auth Method:{Colors.END} {auth_config['name']}")
-            print(f"{Colors.BOLD}Tool:{Colors.END} {tool['name']}")
-            print(f"{Colors.BOLD}Method:{Colors.END} {tool['method']} http://localhost:8000{tool['endpoint']}")
-
-            if auth_config['headers']:
-                print(f"\n{Colors.BOLD}Headers:{Colors.END}")
-                for key, value in auth_config['headers'].items():
-                    # Truncate long values
-                    display_value = value if len(value) < 50 else value[:47] + "..."
-                    print(f"  {key}: {display_value}")
-
-            if auth_config['cookies']:
-                print(f"\n{Colors.BOLD}Cookies:{Colors.END}")
-                for key, value in auth_config['cookies'].items():
-                    print(f"  {key}: {value}")
-
-            if tool['body']:
-                print(f"\n{Colors.BOLD}Body:{Colors.END}")
-                print(f"  {json.dumps(tool['body'], indent=2)}")
-
-            print(f"\n{Colors.BLUE}Sending request...{Colors.END}\n")
-
-            # Make the request
-            try:
-                if tool['method'] == 'GET':
-                    response = await client.get(
-                        f"http://localhost:8000{tool['endpoint']}",
-                        headers=auth_config['headers'],
-                        cookies=auth_config['cookies']
-                    )
-                else:  # POST
-                    response = await client.post(
-                        f"http://localhost:8000{tool['endpoint']}",
-                        headers=auth_config['headers'],
-                        cookies=auth_config['cookies'],
-                        json=tool['body']
-                    )
-
-                # Display response
-                print(f"{Colors.BOLD}Response:{Colors.END}\n")
-                print(f"{Colors.BOLD}Status Code:{Colors.END} ", end="")
-
-                if response.status_code == 200:
-                    print(f"{Colors.GREEN}{response.status_code} OK{Colors.END}")
-                elif response.status_code == 403:
-                    print(f"{Colors.YELLOW}{response.status_code} Forbidden{Colors.END}")
-                else:
-                    print(f"{Colors.RED}{response.status_code}{Colors.END}")
-
-                print(f"\n{Colors.BOLD}Response Body:{Colors.END}")
-                response_json = response.json()
-                print(json.dumps(response_json, indent=2))
-
-                # Highlight key information
-                if response.status_code == 403:
-                    print(f"\n{Colors.YELLOW}⚠ Authorization Failed:{Colors.END}")
-                    if isinstance(response_json, dict) and 'detail' in response_json:
-                        detail = response_json['detail']
-                        if isinstance(detail, dict):
-                            if 'message' in detail:
-                                print(f"  {detail['message']}")
-                            if 'reason' in detail:
-                                print(f"  Reason: {detail['reason']}")
-                elif response.status_code == 200:
-                    print(f"\n{Colors.GREEN}✓ Request Successful!{Colors.END}")
+    while True:
+        # Select auth method
+        print(f"\n{Colors.BOLD}Select Authentication Method:{Colors.END}\n")
+        for key, config in auth_configs.items():
+            print(f"{Colors.GREEN}{key}. {config['name']}{Colors.END}")
+            print(f"   {config['description']}\n")
+
+        auth_choice = input(f"{Colors.BOLD}Choose auth method (1-4, or 'q' to quit): {Colors.END}").strip()
+
+        if auth_choice.lower() == 'q':
+            break
+
+        if auth_choice not in auth_configs:
+            print(f"{Colors.RED}Invalid choice. Please try again.{Colors.END}")
+            continue
+
+        auth_config = auth_configs[auth_choice]
+
+        # Select tool
+        print(f"\n{Colors.BOLD}Select Tool to Call:{Colors.END}\n")
+        for key, tool in tools.items():
+            print(f"{Colors.GREEN}{key}. {tool['name']}{Colors.END}")
+            print(f"   {tool['description']}\n")
+
+        tool_choice = input(f"{Colors.BOLD}Choose tool (1-3): {Colors.END}").strip()
+
+        if tool_choice not in tools:
+            print(f"{Colors.RED}Invalid choice. Please try again.{Colors.END}")
+            continue
+
+        tool = tools[tool_choice]
+
+        # Serialize the body once: Slack signs these exact bytes, and the
+        # fresh timestamp keeps the request inside the replay window
+        body = json.dumps(tool['body']).encode() if tool['body'] is not None else b""
+        _sign_slack_request(auth_configs, body)
+
+        # Display request details (buffered, written in one go)
+        out = io.StringIO()
+        print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}", file=out)
+        print(f"{Colors.BOLD}Request Details:{Colors.END}\n", file=out)
+        print(f"{Colors.BOLD}Auth Method:{Colors.END} {auth_config['name']}", file=out)
+        print(f"{Colors.BOLD}Tool:{Colors.END} {tool['name']}", file=out)
+        print(f"{Colors.BOLD}Method:{Colors.END} {tool['method']} {demo.BASE_URL}{tool['endpoint']}", file=out)
+
+        if auth_config['headers']:
+            print(f"\n{Colors.BOLD}Headers:{Colors.END}", file=out)
+            for key, value in auth_config['headers'].items():
+                # Truncate long values
+                display_value = value if len(value) < 50 else value[:47] + "..."
+                print(f"  {key}: {display_value}", file=out)
+
+        if auth_config['cookies']:
+            print(f"\n{Colors.BOLD}Cookies:{Colors.END}", file=out)
+            for key, value in auth_config['cookies'].items():
+                print(f"  {key}: {value}", file=out)
+
+        if tool['body']:
+            print(f"\n{Colors.BOLD}Body:{Colors.END}", file=out)
+            print(f"  {json.dumps(tool['body'], indent=2)}", file=out)
+
+        print(f"\n{Colors.BLUE}Sending request...{Colors.END}\n", file=out)
+        sys.stdout.write(out.getvalue())
+
+        # Make the request
+        out = io.StringIO()
+        try:
+            if tool['method'] == 'GET':
+                response = await client.get(
+                    tool['endpoint'],
+                    headers=auth_config['headers'],
+                    cookies=auth_config['cookies']
+                )
+            else:  # POST
+                response = await client.post(
+                    tool['endpoint'],
+                    headers={**auth_config['headers'], "content-type": "application/json"},
+                    cookies=auth_config['cookies'],
+                    content=body
+                )
+
+            # Display response
+            print(f"{Colors.BOLD}Response:{Colors.END}\n", file=out)
+            print(f"{Colors.BOLD}Status Code:{Colors.END} ", end="", file=out)
+
+            if response.status_code == 200:
+                print(f"{Colors.GREEN}{response.status_code} OK{Colors.END}", file=out)
+            elif response.status_code == 403:
+                print(f"{Colors.YELLOW}{response.status_code} Forbidden{Colors.END}", file=out)
+            else:
+                print(f"{Colors.RED}{response.status_code}{Colors.END}", file=out)
+
+            print(f"\n{Colors.BOLD}Response Body:{Colors.END}", file=out)
+            response_json = response.json()
+            print(json.dumps(response_json, indent=2), file=out)
+
+            # Highlight key information
+            if response.status_code == 403:
+                print(f"\n{Colors.YELLOW}⚠ Authorization Failed:{Colors.END}", file=out)
+                if isinstance(response_json, dict) and 'detail' in response_json:
+                    detail = response_json['detail']
+                    if isinstance(detail, dict):
+                        if 'message' in detail:
+                            print(f"  {detail['message']}", file=out)
+                        if 'reason' in detail:
+                            print(f"  Reason: {detail['reason']}", file=out)
+            elif response.status_code == 200:
+                print(f"\n{Colors.GREEN}✓ Request Successful!{Colors.END}", file=out)
 
-            except Exception as e:
-                print(f"\n{Colors.RED}Error: {str(e)}{Colors.END}")
+        except Exception as e:
+            print(f"\n{Colors.RED}Error: {str(e)}{Colors.END}", file=out)
 
-            print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}")
+        print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}", file=out)
+        sys.stdout.write(out.getvalue())
 
-            # Ask if user wants to try again
-            again = input(f"\n{Colors.BOLD}Try another combination? (y/n): {Colors.END}").strip().lower()
-            if again != 'y':
-                break
+        # Ask if user wants to try again
+        again = input(f"\n{Colors.BOLD}Try another combination? (y/n): {Colors.END}").strip().lower()
+        if again != 'y':
+            break
 
     print(f"\n{Colors.GREEN}Thanks for exploring the Universal Caller Adapter!{Colors.END}\n")
 
@@ -387,6 +430,17 @@ async def main():
     parser.add_argument('--playground', action='store_true', help='Run interactive playground mode')
     args = parser.parse_args()
 
+    server = ServerManager()
+
+    # Set up signal handlers for clean shutdown
+    def signal_handler(signum, frame):
+        print(f"\n\n{Colors.YELLOW}Interrupted! Cleaning up...{Colors.END}")
+        server.stop()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
     # Determine which demo to run
     if args.simple:
         choice = '1'
@@ -397,42 +451,39 @@ async def main():
     elif args.playground:
         choice = '4'
     else:
-        # Interactive mode
+        # Interactive mode - boot the server while the user picks a demo
         print_banner()
         print_menu()
-        choice = get_user_choice()
+        server.start()
+        try:
+            choice = get_user_choice()
+        except BaseException:
+            server.stop()
+            raise
 
         if choice.lower() == 'q':
+            server.stop()
             print(f"\n{Colors.YELLOW}Goodbye!{Colors.END}\n")
             return
 
-    # Start the server
-    server = ServerManager()
-
-    # Set up signal handlers for clean shutdown
-    def signal_handler(signum, frame):
-        print(f"\n\n{Colors.YELLOW}Interrupted! Cleaning up...{Colors.END}")
-        server.stop()
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
     try:
-        server.start()
-
-        # Run the selected demo(s)
-        if choice == '1':
-            await run_simple_demo()
-        elif choice == '2':
-            await run_full_demo()
-        elif choice == '3':
-            await run_simple_demo()
-            print(f"\n{Colors.BOLD}Press ENTER to continue to comprehensive demo...{Colors.END}")
-            input()
-            await run_full_demo()
-        elif choice == '4':
-            await run_playground_demo()
+        # One shared client (and connection pool) for whichever demos run
+        async with demo.create_client() as client:
+            # Start the server (or wait for the one already booting)
+            await server.start_async()
+
+            # Run the selected demo(s)
+            if choice == '1':
+                await run_simple_demo(client)
+            elif choice == '2':
+                await run_full_demo(client)
+            elif choice == '3':
+                await run_simple_demo(client)
+                print(f"\n{Colors.BOLD}Press ENTER to continue to comprehensive demo...{Colors.END}")
+                input()
+                await run_full_demo(client)
+            elif choice == '4':
+                await run_playground_demo(client)
 
         if choice != '4':  # Playground has its own completion message
             print(f"\n{Colors.BOLD}{Colors.GREEN}{'=' * 80}{Colors.END}")
@@ -443,11 +494,12 @@ async def main():
         print(f"\n\n{Colors.YELLOW}Demo interrupted by user.{Colors.END}")
     except Exception as e:
         print(f"\n\n{Colors.RED}Error running demo: {e}{Colors.END}")
-        import traceback
         traceback.print_exc()
     finally:
         server.stop()
 
 
 if __name__ == "__main__":
+    use_uvloop()
+
     asyncio.run(main())
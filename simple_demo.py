@@ -17,45 +17,20 @@ for each type of login!
 
 import asyncio
 import httpx
-from typing import Dict, Any
+import jwt
+import orjson
+from typing import Dict, Any, Callable, List, Optional, Tuple
 
+import demo
+from src._term import Colors, print_section, print_step, print_success, print_error, print_info, use_uvloop
 
-# Color codes for pretty terminal output
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
 
+# Server binds IPv4 only - connect to it directly, no name resolution
+BASE_URL = "http://127.0.0.1:8000"
 
-def print_section(title: str):
-    """Print a section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{title.center(80)}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}\n")
-
-
-def print_step(step: str):
-    """Print a step description"""
-    print(f"{Colors.YELLOW}➤ {step}{Colors.END}")
-
-
-def print_success(message: str):
-    """Print a success message"""
-    print(f"{Colors.GREEN}✓ {message}{Colors.END}")
-
-
-def print_error(message: str):
-    """Print an error message"""
-    print(f"{Colors.RED}✗ {message}{Colors.END}")
-
-
-def print_info(label: str, value: str):
-    """Print an info line"""
-    print(f"  {Colors.BOLD}{label}:{Colors.END} {value}")
+# Keep-alive pool sized for the demo; idle connections outlive the pauses
+# between ENTER prompts so every request reuses a warm connection
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0)
 
 
 async def show_who_am_i(client: httpx.AsyncClient, headers: Dict[str, str], auth_method: str):
@@ -67,8 +42,8 @@ async def show_who_am_i(client: httpx.AsyncClient, headers: Dict[str, str], auth
     """
     print_step(f"Checking who we are when using {auth_method}...")
 
-    response = await client.get("http://localhost:8000/whoami", headers=headers)
-    data = response.json()
+    response = await client.get("/whoami", headers=headers)
+    data = orjson.loads(response.content)
     principal = data["principal"]  # Extract the nested principal object
 
     print_info("User ID", principal["principal_id"])
@@ -80,16 +55,9 @@ async def show_who_am_i(client: httpx.AsyncClient, headers: Dict[str, str], auth
     return principal
 
 
-async def try_tool_access(
-    client: httpx.AsyncClient,
-    headers: Dict[str, str],
-    tool_name: str,
-    endpoint: str,
-    payload: Dict[str, Any],
-    expected_result: str
-):
+def report_tool_access(tool_name: str, expected_result: str, response) -> bool:
     """
-    Try to access a tool and explain what happens.
+    Explain the outcome of a single tool call.
 
     This shows how authorization works consistently, regardless of how you logged in.
     """
@@ -97,18 +65,15 @@ async def try_tool_access(
     print_info("Why this matters", expected_result)
 
     try:
-        response = await client.post(
-            f"http://localhost:8000{endpoint}",
-            json=payload,
-            headers=headers
-        )
+        if isinstance(response, Exception):
+            raise response
 
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print_success(f"Access granted! {tool_name} returned results.")
             return True
         else:
-            error = response.json()
+            error = orjson.loads(response.content)
             print_error(f"Access denied: {error.get('detail', {}).get('error', 'Unknown error')}")
             return False
 
@@ -119,8 +84,52 @@ async def try_tool_access(
         print()
 
 
-async def main():
-    """Run the simple demo"""
+async def try_tool_access(
+    client: httpx.AsyncClient,
+    headers: Dict[str, str],
+    *attempts: Tuple[str, str, Dict[str, Any], str],
+    sign: Optional[Callable[[bytes], Dict[str, str]]] = None
+) -> List[bool]:
+    """
+    Try to access one or more tools and explain what happens.
+
+    The calls don't depend on each other, so they are sent concurrently;
+    the explanations are still printed in the order given.
+
+    Args:
+        attempts: (tool_name, endpoint, payload, expected_result) tuples
+        sign: Builds per-request headers from the body (e.g. a Slack
+            signature, which covers the body and so differs per attempt)
+    """
+    headers = {**headers, "content-type": "application/json"}
+
+    def post(endpoint: str, payload: Dict[str, Any]):
+        body = orjson.dumps(payload)
+        request_headers = {**headers, **sign(body)} if sign else headers
+        return client.post(endpoint, content=body, headers=request_headers)
+
+    responses = await asyncio.gather(
+        *(post(endpoint, payload) for _, endpoint, payload, _ in attempts),
+        return_exceptions=True
+    )
+    return [
+        report_tool_access(tool_name, expected_result, response)
+        for (tool_name, _, _, expected_result), response in zip(attempts, responses)
+    ]
+
+
+async def main(client: httpx.AsyncClient = None):
+    """
+    Run the simple demo.
+
+    Args:
+        client: Shared HTTP client (a new one is created if not provided)
+    """
+    if client is None:
+        # Limits live on the transport (a client ignores limits= when given one)
+        transport = httpx.AsyncHTTPTransport(limits=CLIENT_LIMITS, retries=1)
+        async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0, transport=transport) as client:
+            return await main(client)
 
     print_section("UNIVERSAL CALLER ADAPTER - Simple Demo")
 
@@ -136,108 +145,87 @@ Let's see it in action...
 
     input(f"{Colors.BOLD}Press ENTER to start...{Colors.END}")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-
-        # ================================================================
-        # SCENARIO 1: Cookie Authentication (like a web login)
-        # ================================================================
-        print_section("SCENARIO 1: Cookie Authentication")
+    # ================================================================
+    # SCENARIO 1: Cookie Authentication (like a web login)
+    # ================================================================
+    print_section("SCENARIO 1: Cookie Authentication")
 
-        print("""
+    print("""
 Imagine you logged into a website with your username and password.
 The website gave you a session cookie. Let's use that cookie to make requests.
-        """)
+    """)
 
-        cookie_headers = {"Cookie": "session_id=sess_alice_123"}
-        alice = await show_who_am_i(client, cookie_headers, "Cookie")
+    cookie_headers = {"Cookie": "session_id=sess_alice_123"}
+    alice = await show_who_am_i(client, cookie_headers, "Cookie")
 
-        print("Notice we became user 'user_alice' with STRONG authentication.")
-        print("Alice has several permissions: rag:read, rag:write, diag:read")
-        print()
+    print("Notice we became user 'user_alice' with STRONG authentication.")
+    print("Alice has several permissions: rag:read, rag:write, diag:read")
+    print()
 
-        input(f"{Colors.BOLD}Press ENTER to continue...{Colors.END}")
+    input(f"{Colors.BOLD}Press ENTER to continue...{Colors.END}")
 
+    await try_tool_access(
+        client,
+        cookie_headers,
         # Try accessing RAG search (should work - Alice has rag:read)
-        await try_tool_access(
-            client,
-            cookie_headers,
-            "RAG Search",
-            "/tools/rag-search",
-            {"query": "What is the universal adapter?"},
-            "Alice has 'rag:read' permission, so this should work"
-        )
-
+        ("RAG Search", "/tools/rag-search", {"query": "What is the universal adapter?"},
+         "Alice has 'rag:read' permission, so this should work"),
         # Try accessing diagnostics (should work - Alice has diag:read AND strong auth)
-        await try_tool_access(
-            client,
-            cookie_headers,
-            "System Diagnostics",
-            "/tools/diagnostics",
-            {},
-            "Alice has 'diag:read' AND strong authentication, so this should work"
-        )
-
-        input(f"{Colors.BOLD}Press ENTER for next scenario...{Colors.END}")
-
-        # ================================================================
-        # SCENARIO 2: OAuth Token (like an API token)
-        # ================================================================
-        print_section("SCENARIO 2: OAuth Token Authentication")
-
-        print("""
+        ("System Diagnostics", "/tools/diagnostics", {},
+         "Alice has 'diag:read' AND strong authentication, so this should work")
+    )
+
+    input(f"{Colors.BOLD}Press ENTER for next scenario...{Colors.END}")
+
+    # ================================================================
+    # SCENARIO 2: OAuth Token (like an API token)
+    # ================================================================
+    print_section("SCENARIO 2: OAuth Token Authentication")
+
+    print("""
 Now imagine you're using an API token (OAuth) instead of a cookie.
 This is common for mobile apps or third-party integrations.
 
 Here's the cool part: Even though we're using a COMPLETELY DIFFERENT
 authentication method, we still become a Principal on the other side!
-        """)
-
-        # Create a mock JWT token for demo (in real demo, this is a real JWT)
-        # For this simple demo, we'll use a pre-generated token from the OAuth adapter
-        import jwt
-        token = jwt.encode(
-            {"sub": "oauth_user_admin", "scope": "admin"},
-            "demo-secret-key",
-            algorithm="HS256"
-        )
-
-        oauth_headers = {"Authorization": f"Bearer {token}"}
-        admin = await show_who_am_i(client, oauth_headers, "OAuth Token")
-
-        print("Notice we became 'oauth_user_admin' with STRONG authentication.")
-        print("This admin has MORE permissions: rag:read, rag:write, diag:read, diag:write")
-        print()
+    """)
 
-        input(f"{Colors.BOLD}Press ENTER to continue...{Colors.END}")
+    # Create a mock JWT token for demo (in real demo, this is a real JWT)
+    # For this simple demo, we'll use a pre-generated token from the OAuth adapter
+    token = jwt.encode(
+        {"sub": "oauth_user_admin", "scope": "admin"},
+        "demo-secret-key",
+        algorithm="HS256"
+    )
 
-        # Try accessing RAG search (should work - admin has rag:read)
-        await try_tool_access(
-            client,
-            oauth_headers,
-            "RAG Search",
-            "/tools/rag-search",
-            {"query": "How does OAuth work?"},
-            "Admin has 'rag:read' permission, so this should work"
-        )
+    oauth_headers = {"Authorization": f"Bearer {token}"}
+    admin = await show_who_am_i(client, oauth_headers, "OAuth Token")
+
+    print("Notice we became 'oauth_user_admin' with STRONG authentication.")
+    print("This admin has MORE permissions: rag:read, rag:write, diag:read, diag:write")
+    print()
+
+    input(f"{Colors.BOLD}Press ENTER to continue...{Colors.END}")
 
+    await try_tool_access(
+        client,
+        oauth_headers,
+        # Try accessing RAG search (should work - admin has rag:read)
+        ("RAG Search", "/tools/rag-search", {"query": "How does OAuth work?"},
+         "Admin has 'rag:read' permission, so this should work"),
         # Try accessing diagnostics (should work - admin has diag:read AND strong auth)
-        await try_tool_access(
-            client,
-            oauth_headers,
-            "System Diagnostics",
-            "/tools/diagnostics",
-            {},
-            "Admin has 'diag:read' AND strong authentication, so this should work"
-        )
-
-        input(f"{Colors.BOLD}Press ENTER for next scenario...{Colors.END}")
-
-        # ================================================================
-        # SCENARIO 3: Slack Authentication (weaker auth)
-        # ================================================================
-        print_section("SCENARIO 3: Slack Bot Authentication")
-
-        print("""
+        ("System Diagnostics", "/tools/diagnostics", {},
+         "Admin has 'diag:read' AND strong authentication, so this should work")
+    )
+
+    input(f"{Colors.BOLD}Press ENTER for next scenario...{Colors.END}")
+
+    # ================================================================
+    # SCENARIO 3: Slack Authentication (weaker auth)
+    # ================================================================
+    print_section("SCENARIO 3: Slack Bot Authentication")
+
+    print("""
 Now let's use Slack authentication. This is when a Slack bot calls your API.
 
 Here's something important: Slack authentication is considered WEAKER because:
@@ -246,105 +234,83 @@ Here's something important: Slack authentication is considered WEAKER because:
 - It's less secure than a proper login
 
 Because of this, we give Slack users WEAKER permissions.
-        """)
-
-        slack_headers = {
-            "x-slack-signature": "v0=mock_signature",
-            "x-slack-request-timestamp": "1234567890",
-            "Content-Type": "application/json"
-        }
+    """)
 
-        # For this demo, we'll mock the Slack user
-        # In the real system, this comes from the request body
-        charlie = await show_who_am_i(client, slack_headers, "Slack Bot")
+    # Each request is signed with the demo signing secret (the signature
+    # covers the timestamp and body). For this demo the Slack user comes
+    # from a header - in the real system, it comes from the request body.
+    charlie = await show_who_am_i(client, demo.slack_headers(), "Slack Bot")
 
-        print("Notice we became a Slack user with WEAK authentication.")
-        print("Slack users only get 'rag:read' permission.")
-        print()
+    print("Notice we became a Slack user with WEAK authentication.")
+    print("Slack users only get 'rag:read' permission.")
+    print()
 
-        input(f"{Colors.BOLD}Press ENTER to continue...{Colors.END}")
+    input(f"{Colors.BOLD}Press ENTER to continue...{Colors.END}")
 
+    await try_tool_access(
+        client,
+        {},
         # Try accessing RAG search (should work - Slack user has rag:read, and RAG allows WEAK auth)
-        await try_tool_access(
-            client,
-            slack_headers,
-            "RAG Search",
-            "/tools/rag-search",
-            {"query": "What can Slack bots do?", "user_id": "U01ABC123"},
-            "Slack user has 'rag:read' AND RAG Search allows WEAK auth, so this should work"
-        )
-
+        ("RAG Search", "/tools/rag-search", {"query": "What can Slack bots do?", "user_id": "U01ABC123"},
+         "Slack user has 'rag:read' AND RAG Search allows WEAK auth, so this should work"),
         # Try accessing diagnostics (should FAIL - Slack is WEAK auth, but diagnostics requires STRONG)
-        await try_tool_access(
-            client,
-            slack_headers,
-            "System Diagnostics",
-            "/tools/diagnostics",
-            {},
-            "Slack user has 'diag:read' BUT Slack is WEAK auth. Diagnostics requires STRONG auth, so this should FAIL"
-        )
-
-        print(f"{Colors.BOLD}☝️  This is the key security feature!{Colors.END}")
-        print("Even though the Slack user has the right permission (diag:read),")
-        print("they can't access sensitive diagnostics because Slack auth is WEAK.")
-        print("This protects sensitive operations from less-secure auth methods.")
-        print()
+        ("System Diagnostics", "/tools/diagnostics", {},
+         "Slack user has 'diag:read' BUT Slack is WEAK auth. Diagnostics requires STRONG auth, so this should FAIL"),
+        sign=demo.slack_headers
+    )
+
+    print(f"{Colors.BOLD}☝️  This is the key security feature!{Colors.END}")
+    print("Even though the Slack user has the right permission (diag:read),")
+    print("they can't access sensitive diagnostics because Slack auth is WEAK.")
+    print("This protects sensitive operations from less-secure auth methods.")
+    print()
 
-        input(f"{Colors.BOLD}Press ENTER for next scenario...{Colors.END}")
+    input(f"{Colors.BOLD}Press ENTER for next scenario...{Colors.END}")
 
-        # ================================================================
-        # SCENARIO 4: Missing Permissions
-        # ================================================================
-        print_section("SCENARIO 4: User Without Permissions")
+    # ================================================================
+    # SCENARIO 4: Missing Permissions
+    # ================================================================
+    print_section("SCENARIO 4: User Without Permissions")
 
-        print("""
+    print("""
 Finally, let's see what happens when someone doesn't have the right permissions.
 We'll use Bob's cookie - Bob only has 'rag:read' permission (no diagnostics access).
-        """)
+    """)
 
-        bob_headers = {"Cookie": "session_id=sess_bob_456"}
-        bob = await show_who_am_i(client, bob_headers, "Cookie (Bob)")
+    bob_headers = {"Cookie": "session_id=sess_bob_456"}
+    bob = await show_who_am_i(client, bob_headers, "Cookie (Bob)")
 
-        print("Bob has STRONG authentication (cookie login), but LIMITED permissions.")
-        print("Bob only has: rag:read")
-        print()
+    print("Bob has STRONG authentication (cookie login), but LIMITED permissions.")
+    print("Bob only has: rag:read")
+    print()
 
-        input(f"{Colors.BOLD}Press ENTER to continue...{Colors.END}")
+    input(f"{Colors.BOLD}Press ENTER to continue...{Colors.END}")
 
+    await try_tool_access(
+        client,
+        bob_headers,
         # Try accessing RAG search (should work - Bob has rag:read)
-        await try_tool_access(
-            client,
-            bob_headers,
-            "RAG Search",
-            "/tools/rag-search",
-            {"query": "What can Bob access?"},
-            "Bob has 'rag:read' permission, so this should work"
-        )
-
+        ("RAG Search", "/tools/rag-search", {"query": "What can Bob access?"},
+         "Bob has 'rag:read' permission, so this should work"),
         # Try accessing diagnostics (should FAIL - Bob doesn't have diag:read)
-        await try_tool_access(
-            client,
-            bob_headers,
-            "System Diagnostics",
-            "/tools/diagnostics",
-            {},
-            "Bob does NOT have 'diag:read' permission, so this should FAIL"
-        )
-
-        print(f"{Colors.BOLD}☝️  Another key security feature!{Colors.END}")
-        print("Bob has STRONG authentication, but he still can't access diagnostics")
-        print("because he doesn't have the 'diag:read' permission.")
-        print("Both auth strength AND permissions must be satisfied.")
-        print()
+        ("System Diagnostics", "/tools/diagnostics", {},
+         "Bob does NOT have 'diag:read' permission, so this should FAIL")
+    )
+
+    print(f"{Colors.BOLD}☝️  Another key security feature!{Colors.END}")
+    print("Bob has STRONG authentication, but he still can't access diagnostics")
+    print("because he doesn't have the 'diag:read' permission.")
+    print("Both auth strength AND permissions must be satisfied.")
+    print()
 
-        input(f"{Colors.BOLD}Press ENTER for summary...{Colors.END}")
+    input(f"{Colors.BOLD}Press ENTER for summary...{Colors.END}")
 
-        # ================================================================
-        # SUMMARY
-        # ================================================================
-        print_section("SUMMARY: Why This Matters")
+    # ================================================================
+    # SUMMARY
+    # ================================================================
+    print_section("SUMMARY: Why This Matters")
 
-        print(f"""
+    print(f"""
 {Colors.BOLD}What we just saw:{Colors.END}
 
 1. {Colors.GREEN}UNIFIED MODEL{Colors.END}
@@ -375,10 +341,12 @@ We'll use Bob's cookie - Bob only has 'rag:read' permission (no diagnostics acce
 - Your code stays clean and easy to maintain.
 
 {Colors.BOLD}This is the Universal Caller Adapter pattern!{Colors.END}
-        """)
+    """)
 
 
 if __name__ == "__main__":
+    use_uvloop()
+
     print("\n" + Colors.BOLD + "=" * 80 + Colors.END)
     print(Colors.BOLD + "Starting Simple Demo - Make sure the server is running!".center(80) + Colors.END)
     print(Colors.BOLD + "(Tip: Use 'python run_demo.py' for automatic server management)".center(80) + Colors.END)
@@ -390,4 +358,4 @@ if __name__ == "__main__":
         print(f"\n\n{Colors.YELLOW}Demo interrupted by user.{Colors.END}")
     except Exception as e:
         print(f"\n\n{Colors.RED}Error: {str(e)}{Colors.END}")
-        print(f"{Colors.YELLOW}Make sure the server is running on http://localhost:8000{Colors.END}")
+        print(f"{Colors.YELLOW}Make sure the server is running on {BASE_URL}{Colors.END}")
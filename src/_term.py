@@ -0,0 +1,58 @@
+"""Terminal colour codes, print helpers and event loop setup shared by the demo scripts."""
+import asyncio
+import sys
+
+
+class Colors:
+    HEADER = '\033[95m'
+    BLUE = '\033[94m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+
+# Prefixes/suffixes precomputed once; each helper is a single write()
+_RULE = f"{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}\n"
+_SECTION = f"{Colors.BOLD}{Colors.BLUE}"
+_STEP = f"{Colors.YELLOW}➤ "
+_SUCCESS = f"{Colors.GREEN}✓ "
+_ERROR = f"{Colors.RED}✗ "
+_LABEL = f"  {Colors.BOLD}"
+_LABEL_END = f":{Colors.END} "
+_END = f"{Colors.END}\n"
+
+
+def print_section(title: str):
+    """Print a section header"""
+    sys.stdout.write("\n" + _RULE + _SECTION + title.center(80) + _END + _RULE + "\n")
+
+
+def print_step(step: str):
+    """Print a step description"""
+    sys.stdout.write(_STEP + step + _END)
+
+
+def print_success(message: str):
+    """Print a success message"""
+    sys.stdout.write(_SUCCESS + message + _END)
+
+
+def print_error(message: str):
+    """Print an error message"""
+    sys.stdout.write(_ERROR + message + _END)
+
+
+def print_info(label: str, value: str):
+    """Print an info line"""
+    sys.stdout.write(_LABEL + label + _LABEL_END + value + "\n")
+
+
+def use_uvloop():
+    """Use the libuv-backed event loop when available (ships with uvicorn[standard])"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
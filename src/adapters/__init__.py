@@ -1,7 +1,7 @@
 """Authentication adapters - normalize different entry points to Principal."""
-from .base import AuthAdapter
+from .base import BaseAuthAdapter, AuthAdapter, SyncAuthAdapter
 from .cookie import CookieAdapter
 from .oauth import OAuthAdapter
 from .slack import SlackAdapter
 
-__all__ = ["AuthAdapter", "CookieAdapter", "OAuthAdapter", "SlackAdapter"]
+__all__ = ["BaseAuthAdapter", "AuthAdapter", "SyncAuthAdapter", "CookieAdapter", "OAuthAdapter", "SlackAdapter"]
@@ -1,35 +1,71 @@
 """Base authentication adapter interface."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 from fastapi import Request
 
-from src.models import Principal
+from src.models import Principal, AuthMethod
 
 
-class AuthAdapter(ABC):
+def freeze_entitlements(users: Dict[str, dict]) -> Dict[str, dict]:
     """
-    Base interface for authentication adapters.
+    Copy a {key -> user_data} table with each user's entitlements as a frozenset.
+
+    Done once at adapter construction, so every Principal built from the
+    table can share the frozen set as-is.
+    """
+    return {
+        key: {**user_data, "entitlements": frozenset(user_data.get("entitlements", ()))}
+        for key, user_data in users.items()
+    }
+
+
+class BaseAuthAdapter(ABC):
+    """
+    Common base for authentication adapters.
 
     Each adapter is responsible for:
-    1. Detecting if a request matches its auth method
+    1. Declaring the auth method it handles (the middleware routes on it)
     2. Extracting and validating credentials
     3. Resolving to a Principal
 
     Adapters should NOT perform authorization - only authentication.
+
+    Subclass AuthAdapter (async) or SyncAuthAdapter (no I/O), never this
+    directly - it deliberately declares no authenticate() of its own.
+    """
+
+    auth_method: AuthMethod
+
+
+class AuthAdapter(BaseAuthAdapter):
+    """
+    Adapter whose authentication may await I/O (e.g. reading the request body).
+
+    Callers await authenticate().
     """
 
     @abstractmethod
-    async def can_handle(self, request: Request) -> bool:
+    async def authenticate(self, request: Request) -> Optional[Principal]:
         """
-        Check if this adapter can handle the given request.
+        Authenticate the request and resolve to a Principal.
 
         Returns:
-            True if this adapter recognizes the auth method in the request
+            Principal if authentication succeeds, None if it fails
         """
         pass
 
+
+class SyncAuthAdapter(BaseAuthAdapter):
+    """
+    Adapter whose authentication is pure in-memory work (no I/O).
+
+    authenticate() is a plain method, so the middleware calls it directly
+    instead of creating and awaiting a coroutine. Use AuthAdapter when
+    authentication needs to await anything.
+    """
+
     @abstractmethod
-    async def authenticate(self, request: Request) -> Optional[Principal]:
+    def authenticate(self, request: Request) -> Optional[Principal]:
         """
         Authenticate the request and resolve to a Principal.
 
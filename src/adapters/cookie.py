@@ -3,10 +3,10 @@ from typing import Optional
 from fastapi import Request
 
 from src.models import Principal, AuthMethod, AuthStrength
-from .base import AuthAdapter
+from .base import SyncAuthAdapter, freeze_entitlements
 
 
-class CookieAdapter(AuthAdapter):
+class CookieAdapter(SyncAuthAdapter):
     """
     Authenticates via platform session cookies.
 
@@ -19,12 +19,14 @@ class CookieAdapter(AuthAdapter):
     For POC: simulates session lookup with hardcoded data.
     """
 
+    auth_method = AuthMethod.COOKIE
+
     def __init__(self, session_store: dict = None):
         """
         Args:
             session_store: Mock session storage {session_id -> user_data}
         """
-        self.session_store = session_store or {
+        session_store = session_store or {
             "sess_alice_123": {
                 "principal_id": "user_alice",
                 "tenant_id": "acme_corp",
@@ -36,26 +38,24 @@ class CookieAdapter(AuthAdapter):
                 "entitlements": {"rag:read"}
             }
         }
+        self.session_store = freeze_entitlements(session_store)
+        # Sessions don't change, so build each session's Principal up front
+        self._principals = {
+            session_id: Principal(
+                principal_id=user_data["principal_id"],
+                tenant_id=user_data.get("tenant_id"),
+                auth_method=AuthMethod.COOKIE,
+                auth_strength=AuthStrength.STRONG,
+                entitlements=user_data["entitlements"]
+            )
+            for session_id, user_data in self.session_store.items()
+        }
 
-    async def can_handle(self, request: Request) -> bool:
-        """Check if request has a session cookie."""
-        return "session_id" in request.cookies
-
-    async def authenticate(self, request: Request) -> Optional[Principal]:
+    def authenticate(self, request: Request) -> Optional[Principal]:
         """Authenticate via session cookie."""
         session_id = request.cookies.get("session_id")
         if not session_id:
             return None
 
         # Simulate session lookup
-        user_data = self.session_store.get(session_id)
-        if not user_data:
-            return None
-
-        return Principal(
-            principal_id=user_data["principal_id"],
-            tenant_id=user_data.get("tenant_id"),
-            auth_method=AuthMethod.COOKIE,
-            auth_strength=AuthStrength.STRONG,
-            entitlements=set(user_data.get("entitlements", []))
-        )
+        return self._principals.get(session_id)
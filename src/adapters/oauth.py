@@ -1,13 +1,35 @@
 """OAuth/OIDC JWT authentication adapter."""
 import jwt
-from typing import Optional
+import hmac
+import json
+import time
+import base64
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Tuple
 from fastapi import Request
 
 from src.models import Principal, AuthMethod, AuthStrength
-from .base import AuthAdapter
+from .base import SyncAuthAdapter
 
+# Claims whose validation we leave to PyJWT (the fast path only checks exp)
+_SLOW_PATH_CLAIMS = ("nbf", "iat", "aud", "iss")
 
-class OAuthAdapter(AuthAdapter):
+# Header fields the fast path understands; anything else (kid, crit, b64...)
+# is checked by PyJWT
+_FAST_PATH_HEADERS = frozenset(("alg", "typ"))
+
+# Rejections that can never turn into a pass for the same token string
+# (unlike e.g. ImmatureSignatureError), so they are safe to cache
+_PERMANENT_FAILURES = (jwt.InvalidSignatureError, jwt.DecodeError, jwt.ExpiredSignatureError)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class OAuthAdapter(SyncAuthAdapter):
     """
     Authenticates via OAuth 2.0 / OIDC JWT access tokens.
 
@@ -20,58 +42,161 @@ class OAuthAdapter(AuthAdapter):
     For POC: Uses a simplified JWT verification with symmetric key.
     """
 
-    def __init__(self, jwt_secret: str = "demo-secret-key", entitlement_mapping: dict = None):
+    auth_method = AuthMethod.OAUTH
+
+    def __init__(
+        self,
+        jwt_secret: str = "demo-secret-key",
+        entitlement_mapping: dict = None,
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0
+    ):
         """
         Args:
             jwt_secret: Secret key for JWT validation (use JWKS in production)
             entitlement_mapping: Maps user roles/scopes to entitlements
+            cache_size: Max number of verified tokens to remember
+            cache_ttl: Max seconds a verified token is trusted without re-checking
         """
         self.jwt_secret = jwt_secret
-        self.entitlement_mapping = entitlement_mapping or {
+        self._key = jwt_secret.encode()
+        entitlement_mapping = entitlement_mapping or {
             "admin": {"rag:read", "rag:write", "diag:read", "diag:write"},
             "user": {"rag:read", "rag:write"},
             "readonly": {"rag:read"}
         }
+        self.entitlement_mapping = {
+            role: frozenset(entitlements) for role, entitlements in entitlement_mapping.items()
+        }
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        # LRU of checked tokens: token -> (expires_at, Principal or None if rejected)
+        self._cache: OrderedDict[str, Tuple[float, Optional[Principal]]] = OrderedDict()
+        # Principals shared across tokens for the same identity: (sub, tenant, role) -> Principal
+        self._principals: OrderedDict[Tuple[str, Optional[str], str], Principal] = OrderedDict()
 
-    async def can_handle(self, request: Request) -> bool:
-        """Check if request has Bearer token."""
-        auth_header = request.headers.get("Authorization", "")
-        return auth_header.startswith("Bearer ")
-
-    async def authenticate(self, request: Request) -> Optional[Principal]:
+    def authenticate(self, request: Request) -> Optional[Principal]:
         """Authenticate via JWT token."""
-        auth_header = request.headers.get("Authorization", "")
+        auth_header = request.headers.get("authorization", "")
         if not auth_header.startswith("Bearer "):
             return None
 
-        token = auth_header.replace("Bearer ", "")
+        token = auth_header[len("Bearer "):]
+        now = time.time()
+
+        # Repeat token - skip signature verification (either way) until it expires
+        cached = self._cache.get(token)
+        if cached:
+            expires_at, principal = cached
+            if now < expires_at:
+                self._cache.move_to_end(token)
+                return principal
+            del self._cache[token]
 
         try:
             # Verify and decode JWT
-            payload = jwt.decode(
-                token,
-                self.jwt_secret,
-                algorithms=["HS256"]
-            )
+            payload = self._decode(token)
 
             # Extract claims
             principal_id = payload.get("sub")
             tenant_id = payload.get("tenant_id")
             role = payload.get("role", "user")
 
-            if not principal_id:
+            # Claims key the principal cache, so they must be plain (hashable) strings
+            if not (
+                principal_id and isinstance(principal_id, str)
+                and (tenant_id is None or isinstance(tenant_id, str))
+                and isinstance(role, str)
+            ):
+                self._remember(token, now + self.cache_ttl, None)
                 return None
 
-            # Map role to entitlements
-            entitlements = self.entitlement_mapping.get(role, set())
-
-            return Principal(
-                principal_id=principal_id,
-                tenant_id=tenant_id,
-                auth_method=AuthMethod.OAUTH,
-                auth_strength=AuthStrength.STRONG,
-                entitlements=set(entitlements)
-            )
+            principal = self._principal_for(principal_id, tenant_id, role)
 
+        except _PERMANENT_FAILURES:
+            # Bad signature, garbage or expired - don't redo the crypto on retries
+            self._remember(token, now + self.cache_ttl, None)
+            return None
         except jwt.InvalidTokenError:
             return None
+
+        # Trust the result until the token expires (bounded by cache_ttl). The
+        # slow path may hand back a float or numeric-string exp; PyJWT accepted
+        # it as int(exp), so read it the same way
+        expires_at = now + self.cache_ttl
+        if "exp" in payload:
+            expires_at = min(int(payload["exp"]), expires_at)
+        self._remember(token, expires_at, principal)
+        return principal
+
+    def _remember(self, token: str, expires_at: float, principal: Optional[Principal]):
+        """Cache the outcome for a token, evicting the least recently used."""
+        self._cache[token] = (expires_at, principal)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _principal_for(self, principal_id: str, tenant_id: Optional[str], role: str) -> Principal:
+        """Return the shared Principal for an identity, building it on first use."""
+        key = (principal_id, tenant_id, role)
+        principal = self._principals.get(key)
+        if principal:
+            self._principals.move_to_end(key)
+            return principal
+
+        principal = Principal(
+            principal_id=principal_id,
+            tenant_id=tenant_id,
+            auth_method=AuthMethod.OAUTH,
+            auth_strength=AuthStrength.STRONG,
+            # Map role to entitlements
+            entitlements=self.entitlement_mapping.get(role, frozenset())
+        )
+        self._principals[key] = principal
+        if len(self._principals) > self.cache_size:
+            self._principals.popitem(last=False)
+        return principal
+
+    def _decode(self, token: str) -> dict:
+        """
+        Verify an HS256 JWT and return its claims.
+
+        Common tokens are checked directly: HMAC-SHA256 signature plus exp.
+        Anything unusual (other algorithms or header fields, nbf/iat/aud/iss
+        claims, a non-int exp, malformed segments) goes through jwt.decode so
+        semantics match PyJWT exactly.
+
+        Raises:
+            jwt.InvalidTokenError: If the token is invalid
+        """
+        try:
+            header_b64, payload_b64, signature_b64 = token.split(".")
+            header = json.loads(_b64url_decode(header_b64))
+            payload = json.loads(_b64url_decode(payload_b64))
+            signature = _b64url_decode(signature_b64)
+        except ValueError:
+            return self._decode_slow(token)
+
+        if not (
+            isinstance(header, dict) and header.get("alg") == "HS256" and
+            header.keys() <= _FAST_PATH_HEADERS and
+            isinstance(payload, dict) and payload.keys().isdisjoint(_SLOW_PATH_CLAIMS)
+        ):
+            return self._decode_slow(token)
+
+        expected = hmac.new(self._key, f"{header_b64}.{payload_b64}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, signature):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+
+        if "exp" in payload:
+            exp = payload["exp"]
+            # PyJWT truncates floats and parses numeric strings - leave those to it
+            if type(exp) is not int:
+                return self._decode_slow(token)
+            if exp <= time.time():
+                raise jwt.ExpiredSignatureError("Signature has expired")
+
+        return payload
+
+    def _decode_slow(self, token: str) -> dict:
+        """Full PyJWT verification (used for anything off the fast path)."""
+        return jwt.decode(token, self.jwt_secret, algorithms=["HS256"])
@@ -6,7 +6,10 @@ from typing import Optional
 from fastapi import Request
 
 from src.models import Principal, AuthMethod, AuthStrength
-from .base import AuthAdapter
+from .base import AuthAdapter, freeze_entitlements
+
+# Max seconds between a request's timestamp and now (replay window)
+_SLACK_SKEW = 60 * 5
 
 
 class SlackAdapter(AuthAdapter):
@@ -22,9 +25,12 @@ class SlackAdapter(AuthAdapter):
     - Shared secret model
     - Limited user identity verification
 
-    For POC: Simulates signature verification.
+    For POC: the Slack user comes from an x-slack-user-id header rather
+    than the request body.
     """
 
+    auth_method = AuthMethod.SLACK
+
     def __init__(self, signing_secret: str = "slack-signing-secret", user_mapping: dict = None):
         """
         Args:
@@ -32,7 +38,8 @@ class SlackAdapter(AuthAdapter):
             user_mapping: Maps Slack user IDs to internal principals
         """
         self.signing_secret = signing_secret
-        self.user_mapping = user_mapping or {
+        self._key = signing_secret.encode()
+        user_mapping = user_mapping or {
             "U01ABC123": {
                 "principal_id": "slack_user_charlie",
                 "tenant_id": "acme_corp",
@@ -44,56 +51,58 @@ class SlackAdapter(AuthAdapter):
                 "entitlements": {"rag:read"}
             }
         }
-
-    async def can_handle(self, request: Request) -> bool:
-        """Check if request has Slack signature headers."""
-        return (
-            "x-slack-signature" in request.headers and
-            "x-slack-request-timestamp" in request.headers
-        )
+        self.user_mapping = freeze_entitlements(user_mapping)
+        # Known Slack users map to fixed Principals - build them once
+        self._principals = {
+            slack_user_id: Principal(
+                principal_id=user_data["principal_id"],
+                tenant_id=user_data.get("tenant_id"),
+                auth_method=AuthMethod.SLACK,
+                auth_strength=AuthStrength.WEAK,  # Always WEAK for Slack
+                entitlements=user_data["entitlements"]
+            )
+            for slack_user_id, user_data in self.user_mapping.items()
+        }
 
     async def authenticate(self, request: Request) -> Optional[Principal]:
         """Authenticate via Slack signature."""
-        signature = request.headers.get("x-slack-signature")
-        timestamp = request.headers.get("x-slack-request-timestamp")
+        headers = request.headers
+        signature = headers.get("x-slack-signature")
+        timestamp = headers.get("x-slack-request-timestamp")
+        # For POC: the Slack user ID comes from a header (simplified)
+        # In reality, this comes from the request body
+        slack_user_id = headers.get("x-slack-user-id")
 
-        if not signature or not timestamp:
+        if not signature or not timestamp or not slack_user_id:
+            return None
+
+        # Only v0 signatures exist - reject anything else before hashing
+        if not signature.startswith("v0="):
             return None
 
         # Verify timestamp (prevent replay attacks)
         try:
             request_time = int(timestamp)
-            if abs(time.time() - request_time) > 60 * 5:  # 5 minute window
-                return None
         except ValueError:
             return None
+        delta = int(time.time()) - request_time
+        if delta > _SLACK_SKEW or delta < -_SLACK_SKEW:
+            return None
 
-        # In a real implementation, we would:
-        # 1. Read request body
-        # 2. Compute HMAC-SHA256(signing_secret, f"v0:{timestamp}:{body}")
-        # 3. Compare with signature
-
-        # For POC: extract Slack user ID from body/headers (simplified)
-        # In reality, this comes from the request body
-        slack_user_id = request.headers.get("x-slack-user-id")
-
-        if not slack_user_id:
+        # Verify signature: "v0=" + hex(HMAC-SHA256(signing_secret, "v0:{timestamp}:{body}"))
+        body = await request.body()
+        digest = hmac.new(self._key, b"v0:" + timestamp.encode() + b":" + body, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(f"v0={digest}".encode(), signature.encode()):
             return None
 
-        user_data = self.user_mapping.get(slack_user_id)
-        if not user_data:
+        principal = self._principals.get(slack_user_id)
+        if not principal:
             # Unknown Slack user - create limited anonymous principal
             return Principal(
                 principal_id=f"slack_unknown_{slack_user_id}",
                 auth_method=AuthMethod.SLACK,
                 auth_strength=AuthStrength.WEAK,
-                entitlements=set()
+                entitlements=frozenset()
             )
 
-        return Principal(
-            principal_id=user_data["principal_id"],
-            tenant_id=user_data.get("tenant_id"),
-            auth_method=AuthMethod.SLACK,
-            auth_strength=AuthStrength.WEAK,  # Always WEAK for Slack
-            entitlements=set(user_data.get("entitlements", []))
-        )
+        return principal
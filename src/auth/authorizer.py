@@ -1,8 +1,11 @@
 """Centralized authorization - enforces permissions before tool execution."""
-from dataclasses import dataclass
-from typing import Set, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 
 from src.models import Principal, AuthStrength
+from src.models.entitlements import entitlement_mask
 
 
 class AuthorizationError(Exception):
@@ -13,18 +16,53 @@ class AuthorizationError(Exception):
         self.reason = reason
 
 
-@dataclass
+@dataclass(frozen=True)
 class ToolPolicy:
     """
     Authorization policy for a tool.
 
     Defines what permissions and auth strength are required to invoke a tool.
+    Immutable, so required_mask and the Authorizer's compiled check can't go
+    stale.
     """
     tool_name: str
-    required_entitlements: Set[str]
+    required_entitlements: FrozenSet[str] = field(default_factory=frozenset)
     min_auth_strength: AuthStrength = AuthStrength.WEAK
     description: str = ""
 
+    # Bitmask of required_entitlements, checked against Principal.entitlement_mask
+    required_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept any iterable, but store a frozenset (and its mask). Frozen
+        # dataclass - derived fields have to bypass __setattr__
+        if not isinstance(self.required_entitlements, frozenset):
+            object.__setattr__(self, "required_entitlements", frozenset(self.required_entitlements))
+        object.__setattr__(self, "required_mask", entitlement_mask(self.required_entitlements))
+
+
+def _compile_check(required_mask: int, min_strength: int) -> Callable[[Principal], bool]:
+    """
+    Specialize a requirement into an "is this allowed?" check.
+
+    This is the one place the allow rule is spelled out: the caller needs at
+    least min_strength and every entitlement bit in required_mask. Both are
+    baked in as plain ints, and checks that can never fail (no entitlements
+    required, or any strength accepted) are dropped entirely.
+    """
+    min_strength = int(min_strength)
+
+    if not required_mask and min_strength <= AuthStrength.ANONYMOUS:
+        return lambda principal: True
+    if not required_mask:
+        return lambda principal: principal.auth_strength >= min_strength
+    if min_strength <= AuthStrength.ANONYMOUS:
+        return lambda principal: (principal.entitlement_mask & required_mask) == required_mask
+    return lambda principal: (
+        principal.auth_strength >= min_strength and
+        (principal.entitlement_mask & required_mask) == required_mask
+    )
+
 
 class Authorizer:
     """
@@ -39,16 +77,59 @@ class Authorizer:
     - Tools remain auth-agnostic
     """
 
-    def __init__(self, policies: dict[str, ToolPolicy] = None):
+    def __init__(self, policies: dict[str, ToolPolicy] = None, cache_size: int = 1024):
         """
         Args:
             policies: Map of tool_name -> ToolPolicy
+            cache_size: Max number of cached authorization decisions
         """
-        self.policies = policies or {}
+        self._policies: Dict[str, ToolPolicy] = {}
+        self.cache_size = cache_size
+        # LRU of denials: key -> (message, reason). Allowed calls never
+        # reach it - see _authorize_status.
+        self._decision_cache: OrderedDict[tuple, Tuple[str, str]] = OrderedDict()
+        # Policies by integer tool ID, so hot callers can skip the name lookup
+        self._policy_list: List[ToolPolicy] = []
+        self._policy_index: Dict[str, int] = {}
+        # Specialized allow-checks per tool ID (see _compile_check)
+        self._allows: List[Callable[[Principal], bool]] = []
+        for policy in (policies or {}).values():
+            self.register_policy(policy)
 
     def register_policy(self, policy: ToolPolicy):
-        """Register a tool policy."""
-        self.policies[policy.tool_name] = policy
+        """Register a tool policy (replacing any existing one for the tool)."""
+        self._policies[policy.tool_name] = policy
+        tool_id = self._policy_index.get(policy.tool_name)
+        if tool_id is None:
+            self._policy_index[policy.tool_name] = len(self._policy_list)
+            self._policy_list.append(policy)
+            self._allows.append(_compile_check(policy.required_mask, policy.min_auth_strength))
+        else:
+            self._policy_list[tool_id] = policy
+            self._allows[tool_id] = _compile_check(policy.required_mask, policy.min_auth_strength)
+        # Policies changed - previously cached decisions may be stale
+        self._decision_cache.clear()
+
+    @property
+    def policies(self) -> Mapping[str, ToolPolicy]:
+        """
+        Registered policies by tool name (read-only).
+
+        Decisions come from the compiled per-tool checks, so a policy only
+        takes effect through register_policy() - direct writes raise.
+        """
+        return MappingProxyType(self._policies)
+
+    def resolve_tool_id(self, tool_name: str) -> int:
+        """
+        Look up the stable integer ID of a registered tool.
+
+        Resolve once (e.g. at startup) and pass the ID to authorize_by_id().
+
+        Raises:
+            KeyError: If no policy is registered for the tool
+        """
+        return self._policy_index[tool_name]
 
     def authorize(self, principal: Principal, tool_name: str) -> None:
         """
@@ -61,41 +142,117 @@ class Authorizer:
         Raises:
             AuthorizationError: If authorization fails
         """
-        policy = self.policies.get(tool_name)
-        if not policy:
+        tool_id = self._policy_index.get(tool_name)
+        if tool_id is None:
             # No policy defined = allow (fail open for demo)
             # In production, you might fail closed
             return
+        self.authorize_by_id(principal, tool_id)
 
-        # Check authentication strength
-        if not self._check_auth_strength(principal, policy.min_auth_strength):
-            raise AuthorizationError(
-                f"Tool '{tool_name}' requires {policy.min_auth_strength.value} authentication, "
-                f"but caller has {principal.auth_strength.value}",
-                reason="insufficient_auth_strength"
-            )
+    def authorize_by_id(self, principal: Principal, tool_id: int) -> None:
+        """
+        Authorize a principal to invoke a tool, by ID from resolve_tool_id().
 
-        # Check entitlements
-        missing = policy.required_entitlements - principal.entitlements
-        if missing:
-            raise AuthorizationError(
-                f"Tool '{tool_name}' requires entitlements {policy.required_entitlements}, "
-                f"but caller lacks: {missing}",
-                reason="missing_entitlements"
-            )
+        Raises:
+            AuthorizationError: If authorization fails
+        """
+        denial = self._authorize_status(principal, tool_id)
+        if denial:
+            message, reason = denial
+            raise AuthorizationError(message, reason=reason)
+
+    def authorize_batch(self, principal: Principal, tool_names: Sequence[str]) -> None:
+        """
+        Authorize a principal to invoke several tools (e.g. a planned tool chain).
+
+        Merges the policies into one requirement - the union of entitlements
+        and the strongest minimum auth - and checks that once. Only if it
+        fails are the tools checked one by one, so the error names the first
+        tool the principal can't use.
 
-    def _check_auth_strength(self, principal: Principal, min_strength: AuthStrength) -> bool:
-        """Check if principal meets minimum auth strength requirement."""
-        strength_order = {
-            AuthStrength.ANONYMOUS: 0,
-            AuthStrength.WEAK: 1,
-            AuthStrength.STRONG: 2
-        }
+        Raises:
+            AuthorizationError: If authorization fails for any of the tools
+        """
+        required_mask = 0
+        min_strength = AuthStrength.ANONYMOUS
+        for tool_name in tool_names:
+            tool_id = self._policy_index.get(tool_name)
+            if tool_id is None:
+                continue  # No policy = allow (fail open, as in authorize)
+            policy = self._policy_list[tool_id]
+            required_mask |= policy.required_mask
+            if policy.min_auth_strength > min_strength:
+                min_strength = policy.min_auth_strength
+
+        if _compile_check(required_mask, min_strength)(principal):
+            return
+
+        for tool_name in tool_names:
+            self.authorize(principal, tool_name)
+
+    def _authorize_status(self, principal: Principal, tool_id: int) -> Optional[Tuple[str, str]]:
+        """
+        Decide without raising.
+
+        Allowed calls are settled by the tool's specialized check alone;
+        only denials go through the decision cache (for their message).
+        That check is the decision - _explain only says why it failed.
 
-        principal_level = strength_order[principal.auth_strength]
-        required_level = strength_order[min_strength]
+        Returns:
+            None if allowed, otherwise (message, reason) describing the denial
+        """
+        if self._allows[tool_id](principal):
+            return None
 
-        return principal_level >= required_level
+        key = self._cache_key(principal, tool_id)
+        try:
+            denial = self._decision_cache[key]
+            self._decision_cache.move_to_end(key)
+        except KeyError:
+            denial = self._explain(principal, self._policy_list[tool_id])
+            self._decision_cache[key] = denial
+            if len(self._decision_cache) > self.cache_size:
+                self._decision_cache.popitem(last=False)
+        return denial
+
+    @staticmethod
+    def _cache_key(principal: Principal, tool_id: int) -> tuple:
+        """
+        Key a decision by everything it depends on - and nothing else.
+
+        The caller's identity is deliberately left out, so every principal
+        with the same auth strength and entitlements shares one entry.
+        """
+        return (tool_id, principal.auth_strength, principal.entitlement_mask)
+
+    @staticmethod
+    def _explain(principal: Principal, policy: ToolPolicy) -> Tuple[str, str]:
+        """
+        Describe why a principal failed a policy's check.
+
+        Only called once the compiled check has denied: if the strength
+        requirement is met, missing entitlements must be the reason.
+
+        Returns:
+            (message, reason) describing the denial
+        """
+        tool_name = policy.tool_name
+
+        if not _compile_check(0, policy.min_auth_strength)(principal):
+            return (
+                f"Tool '{tool_name}' requires {policy.min_auth_strength.label} authentication, "
+                f"but caller has {principal.auth_strength.label}",
+                "insufficient_auth_strength"
+            )
+
+        # Only build the missing set when denying
+        required = policy.required_entitlements
+        missing = required - principal.entitlements
+        return (
+            f"Tool '{tool_name}' requires entitlements {set(required)}, "
+            f"but caller lacks: {set(missing)}",
+            "missing_entitlements"
+        )
 
     def can_access(self, principal: Principal, tool_name: str) -> bool:
         """
@@ -104,8 +261,6 @@ class Authorizer:
         Returns:
             True if authorized, False otherwise
         """
-        try:
-            self.authorize(principal, tool_name)
-            return True
-        except AuthorizationError:
-            return False
+        tool_id = self._policy_index.get(tool_name)
+        # No policy = allow; otherwise no exception is built just to be caught
+        return tool_id is None or self._authorize_status(principal, tool_id) is None
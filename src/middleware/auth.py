@@ -2,75 +2,144 @@
 Authentication middleware - the entry point that coordinates adapters.
 
 This middleware:
-1. Tries each adapter in order
+1. Classifies the request's credentials once, then tries the adapters that
+   match them in order (first success wins)
 2. Resolves to a Principal (or anonymous if all fail)
 3. Attaches Principal to request state
 4. Never blocks requests - always produces a Principal
 """
-from typing import List
+import logging
+from typing import FrozenSet, List
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from src.models import Principal
-from src.adapters import AuthAdapter
+from src.models import Principal, AuthMethod
+from src.adapters import AuthAdapter, BaseAuthAdapter
 
+logger = logging.getLogger(__name__)
 
-class AuthMiddleware(BaseHTTPMiddleware):
+# Raw (lowercased, as ASGI delivers them) names of headers that carry credentials
+_CREDENTIAL_HEADERS = frozenset((
+    b"authorization", b"x-slack-signature", b"x-slack-request-timestamp", b"cookie"
+))
+
+
+def classify_auth(request: Request) -> FrozenSet[AuthMethod]:
+    """
+    Work out which auth methods a request carries credentials for.
+
+    Makes one pass over the raw ASGI headers instead of asking every adapter
+    in turn (or doing a case-insensitive headers.get() scan per credential).
+
+    Returns:
+        The auth methods whose adapters should be tried (empty if the request
+        carries no credentials)
+    """
+    found = {}
+    for name, value in request.scope["headers"]:
+        if name in _CREDENTIAL_HEADERS and name not in found:
+            found[name] = value
+
+    methods = []
+    if b"cookie" in found and "session_id" in request.cookies:
+        methods.append(AuthMethod.COOKIE)
+    if found.get(b"authorization", b"").startswith(b"Bearer "):
+        methods.append(AuthMethod.OAUTH)
+    if b"x-slack-signature" in found and b"x-slack-request-timestamp" in found:
+        methods.append(AuthMethod.SLACK)
+    return frozenset(methods)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Build a receive channel that yields an already-read body once."""
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+class AuthMiddleware:
     """
     Authentication middleware that normalizes all entry points to a Principal.
 
     Key behavior:
-    - Tries adapters in order (first match wins)
+    - Tries the adapters matching the request's credentials in order
+      (first match wins)
     - Falls back to anonymous Principal if no adapter succeeds
     - Never rejects requests at this layer (authorization happens later)
     - Attaches Principal to request.state for downstream use
+
+    Plain ASGI rather than BaseHTTPMiddleware: it only sets request state,
+    so it has no need for the per-request task group and response bridge.
     """
 
-    def __init__(self, app, adapters: List[AuthAdapter]):
+    def __init__(self, app: ASGIApp, adapters: List[BaseAuthAdapter]):
         """
         Args:
             app: FastAPI application
             adapters: List of auth adapters (order matters - first match wins)
         """
-        super().__init__(app)
+        self.app = app
         self.adapters = adapters
+        # (auth method, bound authenticate, must it be awaited) per adapter,
+        # in configured order - resolved once rather than per request
+        self._authenticators = tuple(
+            (adapter.auth_method, adapter.authenticate, isinstance(adapter, AuthAdapter))
+            for adapter in adapters
+        )
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """
         Resolve request to a Principal and attach to request state.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
         principal = await self._resolve_principal(request)
 
         # Attach to request state for downstream handlers
-        request.state.principal = principal
+        scope.setdefault("state", {})["principal"] = principal
+
+        # An adapter may have consumed the body (Slack signs it). Starlette
+        # caches it on the request; replay it so the endpoint can read it too.
+        body = getattr(request, "_body", None)
+        if body is not None:
+            receive = _replay_body(body, receive)
 
         # Continue processing
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
     async def _resolve_principal(self, request: Request) -> Principal:
         """
-        Try each adapter in order to resolve a Principal.
+        Try, in order, each adapter whose credentials the request carries.
 
         Returns:
             Principal (authenticated or anonymous)
         """
-        for adapter in self.adapters:
-            try:
-                # Check if adapter can handle this request
-                if not await adapter.can_handle(request):
-                    continue
+        methods = classify_auth(request)
+        if not methods:
+            return Principal.anonymous()
+
+        for method, authenticate, is_async in self._authenticators:
+            if method not in methods:
+                continue
 
-                # Try to authenticate
-                principal = await adapter.authenticate(request)
+            try:
+                principal = await authenticate(request) if is_async else authenticate(request)
                 if principal:
                     return principal
 
-            except Exception as e:
-                # Log error but continue trying other adapters
-                # In production, you'd use proper logging
-                print(f"Adapter {adapter.__class__.__name__} failed: {e}")
-                continue
+            except Exception:
+                # Log error (formatted only if DEBUG is on) and try the next adapter
+                logger.debug("Adapter %s failed", type(authenticate.__self__).__name__, exc_info=True)
 
         # No adapter succeeded - return anonymous principal
         return Principal.anonymous()
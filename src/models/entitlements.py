@@ -0,0 +1,31 @@
+"""Entitlement bit registry - packs entitlement sets into int bitmasks."""
+import threading
+from typing import Dict, Iterable
+
+# Entitlement name -> its bit. Grows as new names are seen (the vocabulary
+# is small and comes from configuration).
+ENTITLEMENT_BITS: Dict[str, int] = {}
+
+# Serializes bit assignment: two threads registering different new names
+# must never both claim the same bit
+_REGISTER_LOCK = threading.Lock()
+
+
+def register_entitlement(name: str) -> int:
+    """Return the bit for an entitlement, assigning the next free one if new."""
+    bit = ENTITLEMENT_BITS.get(name)
+    if bit is None:
+        with _REGISTER_LOCK:
+            # Re-check: another thread may have registered it while we waited
+            bit = ENTITLEMENT_BITS.get(name)
+            if bit is None:
+                bit = ENTITLEMENT_BITS[name] = 1 << len(ENTITLEMENT_BITS)
+    return bit
+
+
+def entitlement_mask(entitlements: Iterable[str]) -> int:
+    """Pack entitlement names into a bitmask."""
+    mask = 0
+    for name in entitlements:
+        mask |= register_entitlement(name)
+    return mask
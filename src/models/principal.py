@@ -1,8 +1,10 @@
 """Canonical caller model - the single source of truth for 'who is calling'."""
-from enum import Enum
-from typing import Optional, Set
+from enum import Enum, IntEnum
+from typing import Optional, FrozenSet, Tuple
 from dataclasses import dataclass, field
 
+from .entitlements import entitlement_mask
+
 
 class AuthMethod(str, Enum):
     """How the caller was authenticated."""
@@ -12,14 +14,27 @@ class AuthMethod(str, Enum):
     ANONYMOUS = "anonymous"
 
 
-class AuthStrength(str, Enum):
-    """Security level of the authentication."""
-    STRONG = "strong"
-    WEAK = "weak"
-    ANONYMOUS = "anonymous"
+class AuthStrength(IntEnum):
+    """
+    Security level of the authentication.
+
+    Ordered, so "at least WEAK" is a plain int comparison. Use .label for
+    the lowercase name shown in responses and messages.
+    """
+    ANONYMOUS = 0
+    WEAK = 1
+    STRONG = 2
+
+    @property
+    def label(self) -> str:
+        """Lowercase name, e.g. "strong" (the wire format)."""
+        return _STRENGTH_LABELS[self]
 
 
-@dataclass
+_STRENGTH_LABELS = {strength: strength.name.lower() for strength in AuthStrength}
+
+
+@dataclass(frozen=True, slots=True)
 class Principal:
     """
     Canonical representation of a caller.
@@ -27,12 +42,25 @@ class Principal:
     This is the normalized model that ALL authentication entry points
     must resolve to. Authorization decisions are made based on this
     structure alone.
+
+    Immutable (and hashable), so adapters can hand out shared instances.
     """
     principal_id: str
     tenant_id: Optional[str] = None
     auth_method: AuthMethod = AuthMethod.ANONYMOUS
     auth_strength: AuthStrength = AuthStrength.ANONYMOUS
-    entitlements: Set[str] = field(default_factory=set)
+    entitlements: FrozenSet[str] = field(default_factory=frozenset)
+    # Serialization-ready copy of entitlements, materialized once per Principal
+    entitlements_list: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Entitlements as a bitmask (see entitlements.py) for int-op subset checks
+    entitlement_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass - derived fields have to bypass __setattr__
+        if not isinstance(self.entitlements, frozenset):
+            object.__setattr__(self, "entitlements", frozenset(self.entitlements))
+        object.__setattr__(self, "entitlements_list", tuple(sorted(self.entitlements)))
+        object.__setattr__(self, "entitlement_mask", entitlement_mask(self.entitlements))
 
     @property
     def is_authenticated(self) -> bool:
@@ -50,10 +78,14 @@ class Principal:
 
     @classmethod
     def anonymous(cls) -> "Principal":
-        """Create an anonymous principal for unauthenticated requests."""
-        return cls(
-            principal_id="anonymous",
-            auth_method=AuthMethod.ANONYMOUS,
-            auth_strength=AuthStrength.ANONYMOUS,
-            entitlements=set()
-        )
+        """Return the (shared) anonymous principal for unauthenticated requests."""
+        return _ANONYMOUS
+
+
+# Every anonymous caller is the same immutable value - build it once
+_ANONYMOUS = Principal(
+    principal_id="anonymous",
+    auth_method=AuthMethod.ANONYMOUS,
+    auth_strength=AuthStrength.ANONYMOUS,
+    entitlements=frozenset()
+)
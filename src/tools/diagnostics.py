@@ -5,6 +5,15 @@ import sys
 
 from src.models import Principal
 
+# Host details can't change while the process runs - gather them once
+# (platform.version() and friends may read /proc or spawn uname)
+_SYSTEM_INFO = {
+    "platform": platform.system(),
+    "platform_version": platform.version(),
+    "python_version": sys.version,
+    "architecture": platform.machine()
+}
+
 
 async def diagnostics(principal: Principal) -> Dict[str, Any]:
     """
@@ -24,18 +33,14 @@ async def diagnostics(principal: Principal) -> Dict[str, Any]:
         System diagnostic information
     """
     return {
-        "system": {
-            "platform": platform.system(),
-            "platform_version": platform.version(),
-            "python_version": sys.version,
-            "architecture": platform.machine()
-        },
+        # Copy (4 keys) so a caller mutating the result can't alter later responses
+        "system": dict(_SYSTEM_INFO),
         "principal": {
             "principal_id": principal.principal_id,
             "tenant_id": principal.tenant_id,
             "auth_method": principal.auth_method.value,
-            "auth_strength": principal.auth_strength.value,
-            "entitlements": list(principal.entitlements)
+            "auth_strength": principal.auth_strength.label,
+            "entitlements": principal.entitlements_list
         },
         "warning": "This is sensitive diagnostic data - requires strong auth"
     }
@@ -0,0 +1,90 @@
+"""AuthMiddleware checks: adapter order and body replay to the endpoint."""
+import hashlib
+import hmac
+import json
+import time
+import unittest
+
+from fastapi import FastAPI, Request
+
+from src.adapters import CookieAdapter, OAuthAdapter, SlackAdapter
+from src.middleware import AuthMiddleware
+
+SLACK_SECRET = "slack-signing-secret"
+
+
+def _slack_headers(body: bytes) -> dict:
+    timestamp = str(int(time.time()))
+    base = b"v0:" + timestamp.encode() + b":" + body
+    return {
+        "x-slack-request-timestamp": timestamp,
+        "x-slack-signature": "v0=" + hmac.new(SLACK_SECRET.encode(), base, hashlib.sha256).hexdigest(),
+        "x-slack-user-id": "U01ABC123",
+    }
+
+
+def _headers(headers: dict) -> list:
+    return [(name.encode(), value.encode()) for name, value in headers.items()]
+
+
+async def _post(app, body: bytes, headers: dict) -> dict:
+    """Send one POST straight through the ASGI app and decode the JSON reply."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": "/echo", "raw_path": b"/echo",
+        "query_string": b"", "root_path": "", "headers": _headers(headers),
+        "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+    chunks = [body]
+    sent = []
+
+    async def receive():
+        # Deliver the body once; anything after that is a disconnect
+        if chunks:
+            return {"type": "http.request", "body": chunks.pop(), "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return json.loads(b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body"))
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        return {"principal_id": request.state.principal.principal_id, "body": body.decode()}
+
+    app.add_middleware(
+        AuthMiddleware,
+        adapters=[CookieAdapter(), OAuthAdapter(), SlackAdapter(signing_secret=SLACK_SECRET)]
+    )
+    return app
+
+
+class AuthMiddlewareTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.app = _app()
+
+    async def test_endpoint_receives_body_read_by_adapter(self):
+        body = b'{"query": "What is the capital of France?", "n": [1, 2, 3]}'
+        response = await _post(self.app, body, _slack_headers(body))
+        self.assertEqual(response, {"principal_id": "slack_user_charlie", "body": body.decode()})
+
+    async def test_endpoint_receives_body_when_signature_fails(self):
+        body = b'{"query": "hi"}'
+        response = await _post(self.app, body, _slack_headers(b"something else"))
+        self.assertEqual(response, {"principal_id": "anonymous", "body": body.decode()})
+
+    async def test_falls_through_to_next_adapter(self):
+        response = await _post(
+            self.app, b"", {"authorization": "Bearer junk", "cookie": "session_id=sess_alice_123"}
+        )
+        self.assertEqual(response["principal_id"], "user_alice")
+
+if __name__ == "__main__":
+    unittest.main()
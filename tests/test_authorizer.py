@@ -0,0 +1,148 @@
+"""Authorizer checks: compiled per-tool checks, denial cache and batch authorization."""
+import threading
+import unittest
+
+from src.auth import Authorizer, AuthorizationError, ToolPolicy
+from src.models import Principal, AuthMethod, AuthStrength
+from src.models.entitlements import entitlement_mask, register_entitlement
+
+
+def _principal(strength=AuthStrength.STRONG, entitlements=()):
+    return Principal(
+        principal_id="user_test",
+        tenant_id="acme_corp",
+        auth_method=AuthMethod.OAUTH,
+        auth_strength=strength,
+        entitlements=entitlements
+    )
+
+
+class AuthorizerTest(unittest.TestCase):
+    def setUp(self):
+        self.authorizer = Authorizer()
+        self.authorizer.register_policy(ToolPolicy(
+            tool_name="rag_search",
+            required_entitlements={"rag:read"},
+            min_auth_strength=AuthStrength.WEAK
+        ))
+        self.authorizer.register_policy(ToolPolicy(
+            tool_name="diagnostics",
+            required_entitlements={"diag:read"},
+            min_auth_strength=AuthStrength.STRONG
+        ))
+
+    def assert_denied(self, principal, tool_name, message, reason):
+        with self.assertRaises(AuthorizationError) as ctx:
+            self.authorizer.authorize(principal, tool_name)
+        self.assertEqual((str(ctx.exception), ctx.exception.reason), (message, reason))
+
+    def test_allowed(self):
+        principal = _principal(entitlements={"rag:read", "diag:read"})
+        self.authorizer.authorize(principal, "rag_search")
+        self.authorizer.authorize(principal, "diagnostics")
+        self.authorizer.authorize_by_id(principal, self.authorizer.resolve_tool_id("diagnostics"))
+
+    def test_insufficient_auth_strength(self):
+        self.assert_denied(
+            _principal(AuthStrength.WEAK, {"diag:read"}), "diagnostics",
+            "Tool 'diagnostics' requires strong authentication, but caller has weak",
+            "insufficient_auth_strength"
+        )
+        self.assert_denied(
+            Principal.anonymous(), "rag_search",
+            "Tool 'rag_search' requires weak authentication, but caller has anonymous",
+            "insufficient_auth_strength"
+        )
+
+    def test_missing_entitlements(self):
+        self.assert_denied(
+            _principal(entitlements={"rag:read"}), "diagnostics",
+            "Tool 'diagnostics' requires entitlements {'diag:read'}, but caller lacks: {'diag:read'}",
+            "missing_entitlements"
+        )
+
+    def test_cached_denial_repeats(self):
+        principal = _principal(entitlements={"rag:read"})
+        for _ in range(2):
+            self.assert_denied(
+                principal, "diagnostics",
+                "Tool 'diagnostics' requires entitlements {'diag:read'}, but caller lacks: {'diag:read'}",
+                "missing_entitlements"
+            )
+
+    def test_reregistering_invalidates_check_and_cache(self):
+        principal = _principal(AuthStrength.WEAK, {"rag:read"})
+        self.assertFalse(self.authorizer.can_access(principal, "diagnostics"))  # denial now cached
+
+        self.authorizer.register_policy(ToolPolicy(
+            tool_name="diagnostics",
+            required_entitlements={"rag:read"},
+            min_auth_strength=AuthStrength.WEAK
+        ))
+        self.assertTrue(self.authorizer.can_access(principal, "diagnostics"))
+
+        self.authorizer.register_policy(ToolPolicy(
+            tool_name="diagnostics",
+            required_entitlements={"diag:write"},
+            min_auth_strength=AuthStrength.WEAK
+        ))
+        self.assert_denied(
+            principal, "diagnostics",
+            "Tool 'diagnostics' requires entitlements {'diag:write'}, but caller lacks: {'diag:write'}",
+            "missing_entitlements"
+        )
+
+    def test_batch_allowed(self):
+        principal = _principal(entitlements={"rag:read", "diag:read"})
+        self.authorizer.authorize_batch(principal, ["rag_search", "diagnostics", "unknown_tool"])
+
+    def test_batch_names_first_denied_tool(self):
+        principal = _principal(AuthStrength.WEAK, {"rag:read", "diag:read"})
+        with self.assertRaises(AuthorizationError) as ctx:
+            self.authorizer.authorize_batch(principal, ["rag_search", "diagnostics"])
+        self.assertEqual(ctx.exception.reason, "insufficient_auth_strength")
+        self.assertIn("'diagnostics'", str(ctx.exception))
+
+        with self.assertRaises(AuthorizationError) as ctx:
+            self.authorizer.authorize_batch(Principal.anonymous(), ["diagnostics", "rag_search"])
+        self.assertIn("'diagnostics'", str(ctx.exception))
+
+    def test_unknown_tool_fails_open(self):
+        self.assertTrue(self.authorizer.can_access(Principal.anonymous(), "unknown_tool"))
+        self.authorizer.authorize(Principal.anonymous(), "unknown_tool")
+        with self.assertRaises(KeyError):
+            self.authorizer.resolve_tool_id("unknown_tool")
+
+    def test_policies_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.authorizer.policies["secret"] = ToolPolicy(tool_name="secret")
+        self.assertEqual(set(self.authorizer.policies), {"rag_search", "diagnostics"})
+
+
+class EntitlementRegistryTest(unittest.TestCase):
+    def test_bits_are_stable_and_distinct(self):
+        read, write = register_entitlement("test:read"), register_entitlement("test:write")
+        self.assertNotEqual(read, write)
+        self.assertEqual(register_entitlement("test:read"), read)
+        self.assertEqual(entitlement_mask(["test:read", "test:write"]), read | write)
+
+    def test_concurrent_registration_never_shares_a_bit(self):
+        barrier = threading.Barrier(8)
+        bits = {}
+
+        def register(worker):
+            barrier.wait()
+            for i in range(100):
+                name = f"test:concurrent:{worker}:{i}"
+                bits[name] = register_entitlement(name)
+
+        threads = [threading.Thread(target=register, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(bits.values())), len(bits))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""OAuthAdapter checks: fast HS256 path parity with jwt.decode, and claim validation."""
+import base64
+import hashlib
+import hmac
+import json
+import time
+import unittest
+from unittest import mock
+
+import jwt
+
+from src.adapters.oauth import OAuthAdapter
+
+SECRET = "demo-secret-key"
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _sign(header: dict, payload: dict, secret: str = SECRET) -> str:
+    """Hand-build an HS256 token (jwt.encode won't produce every odd claim)."""
+    signing_input = f"{_b64(json.dumps(header).encode())}.{_b64(json.dumps(payload).encode())}"
+    signature = hmac.new(secret.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{_b64(signature)}"
+
+
+def _outcome(decode, token):
+    """What a decoder does with a token: ("ok", claims) or ("error", exception type)."""
+    try:
+        return "ok", decode(token)
+    except Exception as e:  # PyJWT itself raises TypeError for some exp values
+        return "error", type(e)
+
+
+class DecodeParityTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = OAuthAdapter(jwt_secret=SECRET)
+        self.now = int(time.time())
+
+    def assert_parity(self, token):
+        expected = _outcome(lambda t: jwt.decode(t, SECRET, algorithms=["HS256"]), token)
+        self.assertEqual(_outcome(self.adapter._decode, token), expected)
+        return expected
+
+    def test_valid_token(self):
+        token = jwt.encode({"sub": "user_bob", "role": "admin", "exp": self.now + 60}, SECRET, algorithm="HS256")
+        self.assertEqual(self.assert_parity(token)[0], "ok")
+
+    def test_valid_token_skips_pyjwt(self):
+        token = jwt.encode({"sub": "user_bob", "exp": self.now + 60}, SECRET, algorithm="HS256")
+        with mock.patch("src.adapters.oauth.jwt.decode", side_effect=AssertionError("slow path used")):
+            self.assertEqual(self.adapter._decode(token)["sub"], "user_bob")
+
+    def test_no_exp(self):
+        self.assert_parity(jwt.encode({"sub": "user_bob"}, SECRET, algorithm="HS256"))
+
+    def test_expired(self):
+        token = jwt.encode({"sub": "user_bob", "exp": self.now - 10}, SECRET, algorithm="HS256")
+        self.assertEqual(self.assert_parity(token), ("error", jwt.ExpiredSignatureError))
+
+    def test_bad_signature(self):
+        token = jwt.encode({"sub": "user_bob", "exp": self.now + 60}, "wrong-secret", algorithm="HS256")
+        self.assertEqual(self.assert_parity(token), ("error", jwt.InvalidSignatureError))
+
+    def test_non_hs256_alg(self):
+        for alg in ("HS384", "HS512", "none"):
+            with self.subTest(alg=alg):
+                token = jwt.encode({"sub": "user_bob"}, SECRET if alg != "none" else None, algorithm=alg)
+                self.assertEqual(self.assert_parity(token)[0], "error")
+
+    def test_extra_header_fields(self):
+        for header in ({"alg": "HS256", "kid": 5}, {"alg": "HS256", "typ": "JWT", "kid": "k1"}):
+            with self.subTest(header=header):
+                self.assert_parity(_sign(header, {"sub": "user_bob"}))
+
+    def test_nbf_and_iat(self):
+        for claims in (
+            {"nbf": self.now + 600},
+            {"nbf": self.now - 600},
+            {"iat": self.now},
+            {"iat": "yesterday"},
+        ):
+            with self.subTest(claims=claims):
+                self.assert_parity(_sign({"alg": "HS256"}, {"sub": "user_bob", **claims}))
+
+    def test_malformed_segments(self):
+        valid = jwt.encode({"sub": "user_bob"}, SECRET, algorithm="HS256")
+        header, payload, signature = valid.split(".")
+        for token in (
+            "",
+            "not-a-token",
+            "a.b",
+            f"{header}.{payload}",
+            f"{valid}.extra",
+            f"{header}.!!!.{signature}",
+            f"{header}.{_b64(b'not json')}.{signature}",
+            f"{header}.{_b64(b'[1, 2]')}.{signature}",
+            f"{_b64(b'{')}.{payload}.{signature}",
+            f"{header}.{payload}.é",
+        ):
+            with self.subTest(token=token):
+                self.assertEqual(self.assert_parity(token)[0], "error")
+
+    def test_odd_exp_values(self):
+        for exp in (
+            "soon",
+            str(self.now + 60),
+            True,
+            False,
+            None,
+            [self.now + 60],
+            float(self.now + 60),
+            self.now + 0.5,
+            float(self.now - 60),
+        ):
+            with self.subTest(exp=exp):
+                self.assert_parity(_sign({"alg": "HS256", "typ": "JWT"}, {"sub": "user_bob", "exp": exp}))
+
+
+class AuthenticateTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = OAuthAdapter(jwt_secret=SECRET)
+
+    def _request(self, claims):
+        token = jwt.encode(claims, SECRET, algorithm="HS256")
+        return mock.Mock(headers={"authorization": f"Bearer {token}"}), token
+
+    def test_valid_claims(self):
+        request, _ = self._request({"sub": "user_bob", "tenant_id": "acme", "role": "admin"})
+        principal = self.adapter.authenticate(request)
+        self.assertEqual((principal.principal_id, principal.tenant_id), ("user_bob", "acme"))
+
+    def test_slow_path_exp_values(self):
+        # PyJWT accepts these as int(exp); the cache expiry must read them the same way
+        exp = int(time.time()) + 60
+        for value in (str(exp), float(exp), exp + 0.5):
+            with self.subTest(exp=value):
+                request, token = self._request({"sub": "user_bob", "exp": value})
+                principal = self.adapter.authenticate(request)
+                self.assertEqual(principal.principal_id, "user_bob")
+                self.assertLessEqual(self.adapter._cache[token][0], exp)
+
+    def test_no_exp_cached_for_ttl(self):
+        request, token = self._request({"sub": "user_bob"})
+        before = time.time()
+        self.assertIsNotNone(self.adapter.authenticate(request))
+        self.assertGreaterEqual(self.adapter._cache[token][0], before + self.adapter.cache_ttl)
+
+    def test_non_string_claims_rejected_and_cached(self):
+        for claims in (
+            {"sub": ["user_bob"]},
+            {"sub": {"id": "user_bob"}},
+            {"sub": 42},
+            {"sub": "user_bob", "tenant_id": ["acme"]},
+            {"sub": "user_bob", "role": ["admin"]},
+            {"sub": "user_bob", "role": {"name": "admin"}},
+        ):
+            with self.subTest(claims=claims):
+                request, token = self._request(claims)
+                self.assertIsNone(self.adapter.authenticate(request))
+                self.assertIsNone(self.adapter._cache[token][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""SlackAdapter checks: v0 request signature and timestamp verification."""
+import hashlib
+import hmac
+import time
+import unittest
+
+from fastapi import Request
+
+from src.adapters.slack import SlackAdapter, _SLACK_SKEW
+from src.models import AuthMethod
+
+SECRET = "slack-signing-secret"
+BODY = b'{"query": "hello"}'
+
+
+def _signature(timestamp: str, body: bytes, secret: str = SECRET) -> str:
+    base = b"v0:" + timestamp.encode() + b":" + body
+    return "v0=" + hmac.new(secret.encode(), base, hashlib.sha256).hexdigest()
+
+
+def _request(body: bytes, timestamp: str, signature: str, user_id: str = "U01ABC123") -> Request:
+    """Build a POST request whose body arrives through the ASGI receive channel."""
+    headers = [
+        (b"x-slack-signature", signature.encode()),
+        (b"x-slack-request-timestamp", timestamp.encode()),
+        (b"x-slack-user-id", user_id.encode()),
+    ]
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": headers}, receive)
+
+
+class AuthenticateTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.adapter = SlackAdapter(signing_secret=SECRET)
+        self.timestamp = str(int(time.time()))
+
+    async def test_valid_signature(self):
+        principal = await self.adapter.authenticate(
+            _request(BODY, self.timestamp, _signature(self.timestamp, BODY))
+        )
+        self.assertEqual(principal.principal_id, "slack_user_charlie")
+        self.assertEqual(principal.auth_method, AuthMethod.SLACK)
+
+    async def test_unknown_user_gets_no_entitlements(self):
+        principal = await self.adapter.authenticate(
+            _request(BODY, self.timestamp, _signature(self.timestamp, BODY), user_id="U99")
+        )
+        self.assertEqual(principal.principal_id, "slack_unknown_U99")
+        self.assertEqual(principal.entitlements, frozenset())
+
+    async def test_wrong_body(self):
+        signature = _signature(self.timestamp, BODY)
+        self.assertIsNone(await self.adapter.authenticate(_request(b'{"query": "other"}', self.timestamp, signature)))
+
+    async def test_wrong_secret(self):
+        signature = _signature(self.timestamp, BODY, secret="not-the-secret")
+        self.assertIsNone(await self.adapter.authenticate(_request(BODY, self.timestamp, signature)))
+
+    async def test_missing_v0_prefix(self):
+        signature = _signature(self.timestamp, BODY)
+        for bad in (signature[len("v0="):], "v1=" + signature[len("v0="):]):
+            with self.subTest(signature=bad):
+                self.assertIsNone(await self.adapter.authenticate(_request(BODY, self.timestamp, bad)))
+
+    async def test_timestamp_outside_skew(self):
+        now = int(time.time())
+        for timestamp in (str(now - _SLACK_SKEW - 10), str(now + _SLACK_SKEW + 10)):
+            with self.subTest(timestamp=timestamp):
+                request = _request(BODY, timestamp, _signature(timestamp, BODY))
+                self.assertIsNone(await self.adapter.authenticate(request))
+
+    async def test_non_integer_timestamp(self):
+        timestamp = f"{time.time():.3f}"
+        request = _request(BODY, timestamp, _signature(timestamp, BODY))
+        self.assertIsNone(await self.adapter.authenticate(request))
+
+
+if __name__ == "__main__":
+    unittest.main()